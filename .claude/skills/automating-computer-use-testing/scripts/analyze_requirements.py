@@ -14,6 +14,9 @@ Interactive tool that prompts for:
 Outputs suggested goal file structure based on inputs.
 """
 
+import sys
+
+
 def main():
     print("=== Gemini Computer-Use Automation Requirements Analyzer ===\n")
 
@@ -35,44 +38,47 @@ def main():
     print("\nWhat should be verified visually?")
     visual_verification = input("Visual checks: ").strip()
 
-    # Generate suggested goal structure
-    print("\n" + "="*60)
-    print("SUGGESTED GOAL FILE STRUCTURE")
-    print("="*60 + "\n")
-
-    print(f"You are a QA engineer testing the {app_name}.")
-    print(f"\nYour goal is to validate the {', '.join(features[:3]) if features else 'core functionality'}.")
-    print("\n## Test Session Overview\n")
-    print(f"1. **Navigate to the application** at {app_url}\n")
-    print("2. **Verify Initial Load**:")
+    # Generate suggested goal structure (buffered, written once)
+    out: list[str] = []
+    out.append("\n" + "="*60)
+    out.append("SUGGESTED GOAL FILE STRUCTURE")
+    out.append("="*60 + "\n")
+
+    out.append(f"You are a QA engineer testing the {app_name}.")
+    out.append(f"\nYour goal is to validate the {', '.join(features[:3]) if features else 'core functionality'}.")
+    out.append("\n## Test Session Overview\n")
+    out.append(f"1. **Navigate to the application** at {app_url}\n")
+    out.append("2. **Verify Initial Load**:")
     if visual_verification:
-        print(f"   - {visual_verification}")
-    print("   - Confirm all key UI elements render")
-    print("   - Verify no console errors\n")
+        out.append(f"   - {visual_verification}")
+    out.append("   - Confirm all key UI elements render")
+    out.append("   - Verify no console errors\n")
 
     for i, feature in enumerate(features, start=3):
-        print(f"{i}. **Test {feature}**:")
-        print(f"   - [ACTION: Describe how to test {feature}]")
-        print(f"   - [VERIFY: What should happen when {feature} works correctly]\n")
+        out.append(f"{i}. **Test {feature}**:")
+        out.append(f"   - [ACTION: Describe how to test {feature}]")
+        out.append(f"   - [VERIFY: What should happen when {feature} works correctly]\n")
 
-    print("\n## Success Criteria\n")
+    out.append("\n## Success Criteria\n")
     for criterion in success_criteria:
-        print(f"- {criterion}")
+        out.append(f"- {criterion}")
     if not success_criteria:
-        print("- All features function correctly")
-        print("- No console errors visible")
-        print("- UI matches design specifications")
-
-    print("\n## Reporting\n")
-    print("Document:")
-    print("- **What worked**: Features that behave as expected")
-    print("- **What broke**: Bugs, errors, broken functionality")
-    print("- **UX notes**: Friction points, suggestions")
-    print("\nConclude with QA summary: 'Ready to ship' or 'Needs fixes' with blockers.\n")
-
-    print("="*60)
-    print("Copy the above structure to your goal file and customize as needed.")
-    print("="*60)
+        out.append("- All features function correctly")
+        out.append("- No console errors visible")
+        out.append("- UI matches design specifications")
+
+    out.append("\n## Reporting\n")
+    out.append("Document:")
+    out.append("- **What worked**: Features that behave as expected")
+    out.append("- **What broke**: Bugs, errors, broken functionality")
+    out.append("- **UX notes**: Friction points, suggestions")
+    out.append("\nConclude with QA summary: 'Ready to ship' or 'Needs fixes' with blockers.\n")
+
+    out.append("="*60)
+    out.append("Copy the above structure to your goal file and customize as needed.")
+    out.append("="*60)
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
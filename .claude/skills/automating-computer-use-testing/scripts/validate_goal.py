@@ -13,9 +13,13 @@ Checks:
 - Includes reporting structure
 """
 
+import re
 import sys
 from pathlib import Path
 
+# Numbered list item at the start of a line, e.g. "1. Navigate..."
+STEP_PATTERN = re.compile(r"^[ \t]*\d+\.", re.MULTILINE)
+
 
 def validate_goal_file(file_path: Path) -> tuple[bool, list[str]]:
     """Validate goal file structure.
@@ -37,33 +41,35 @@ def validate_goal_file(file_path: Path) -> tuple[bool, list[str]]:
         errors.append(f"Failed to read file: {e}")
         return False, errors
 
+    # Case-insensitive section checks probe one lowercased copy
+    lowered = content.lower()
+
     # Check for role description
-    if not ("You are" in content or "you are" in content):
+    if "you are" not in lowered:
         errors.append("Missing role description (expected 'You are...')")
 
     # Check for goal statement
-    if not ("Your goal is" in content or "your goal is" in content):
+    if "your goal is" not in lowered:
         errors.append("Missing goal statement (expected 'Your goal is...')")
 
     # Check for test steps (numbered list)
-    numbered_steps = [line for line in content.split('\n')
-                      if line.strip() and line.strip()[0].isdigit() and '.' in line[:5]]
-    if len(numbered_steps) < 3:
-        errors.append(f"Insufficient test steps (found {len(numbered_steps)}, expected at least 3)")
+    step_count = len(STEP_PATTERN.findall(content))
+    if step_count < 3:
+        errors.append(f"Insufficient test steps (found {step_count}, expected at least 3)")
 
     # Check for success criteria
-    if not ("Success Criteria" in content or "success criteria" in content):
+    if "success criteria" not in lowered:
         errors.append("Missing success criteria section")
 
     # Check for reporting structure
-    if not ("Reporting" in content or "reporting" in content or "Report" in content):
+    if "report" not in lowered:
         errors.append("Missing reporting section")
 
     # Check for specific reporting elements
-    if "What worked" not in content and "what worked" not in content:
+    if "what worked" not in lowered:
         errors.append("Missing 'What worked' in reporting section")
 
-    if "What broke" not in content and "what broke" not in content:
+    if "what broke" not in lowered:
         errors.append("Missing 'What broke' in reporting section")
 
     # Validate file length (should have substantial content)
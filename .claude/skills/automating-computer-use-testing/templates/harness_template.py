@@ -23,10 +23,11 @@ The script expects `playwright` browsers to be installed (`pip install playwrigh
 
 from __future__ import annotations
 
+import functools
 import os
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 try:
     from termcolor import cprint
@@ -85,6 +86,10 @@ EXCLUDED_FUNCTIONS = [
     if fn.strip()
 ]
 
+SETTLE_TIMEOUT_MS = 300
+SCREENSHOT_QUALITY = 80
+SCREENSHOT_MIME_TYPE = "image/jpeg"
+
 TURN_LIMIT = int(os.getenv("CHRISTINA_COMPUTER_USE_TURNS", "30"))
 HEADLESS = os.getenv("CHRISTINA_COMPUTER_USE_HEADLESS", "false").lower() in {"1", "true", "yes"}
 
@@ -94,11 +99,12 @@ HEADLESS = os.getenv("CHRISTINA_COMPUTER_USE_HEADLESS", "false").lower() in {"1"
 # ---------------------------------------------------------------------------
 def denormalize_x(x: int, screen_width: int) -> int:
     """Gemini returns coordinates normalised to 0..999 – convert to pixels."""
-    return int(x / 1000 * screen_width)
+    # int() guards against whole-number floats from the JSON args; the rest is integer-only
+    return int(x) * screen_width // 1000
 
 
 def denormalize_y(y: int, screen_height: int) -> int:
-    return int(y / 1000 * screen_height)
+    return int(y) * screen_height // 1000
 
 
 KEY_ALIASES = {
@@ -126,35 +132,66 @@ KEY_ALIASES = {
 }
 
 
+# Sets the focused input/textarea value through the native setter so framework-controlled
+# inputs (e.g. React) see the change, then fires input/change. Returns False when the
+# focused element isn't a text field so the caller can fall back to keyboard typing.
+FILL_ACTIVE_ELEMENT_JS = """
+(value) => {
+  const el = document.activeElement;
+  if (!(el instanceof HTMLInputElement || el instanceof HTMLTextAreaElement)) {
+    return false;
+  }
+  const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), "value").set;
+  setter.call(el, value);
+  el.dispatchEvent(new Event("input", { bubbles: true }));
+  el.dispatchEvent(new Event("change", { bubbles: true }));
+  return true;
+}
+"""
+
+
+@functools.lru_cache(maxsize=256)
 def normalize_key_token(token: str) -> str:
+    # Single printable characters are the common case; skip strip/lower entirely
+    if len(token) == 1 and not token.isspace():
+        return token.upper()
     token_lower = token.strip().lower()
     if not token_lower:
         return ''
-    if token_lower in KEY_ALIASES:
-        return KEY_ALIASES[token_lower]
+    alias = KEY_ALIASES.get(token_lower)
+    if alias:
+        return alias
     if len(token_lower) == 1:
         return token_lower.upper()
     return token_lower.capitalize()
 
 
+@functools.lru_cache(maxsize=256)
 def normalize_key_combo(value: str) -> str:
-    separators = '+' if '+' in value else ('-' if '-' in value else None)
-    if separators:
-        parts = [normalize_key_token(part) for part in value.replace('-', '+').split('+')]
-        parts = [part for part in parts if part]
-        return '+'.join(parts) if parts else ''
-    return normalize_key_token(value)
+    if '+' not in value and '-' not in value:
+        return normalize_key_token(value)
+    parts = [normalize_key_token(part) for part in value.replace('-', '+').split('+')]
+    return '+'.join(part for part in parts if part)
 
 
 def prune_contents(contents: List[Content], keep_turns: int = 5) -> None:
-    if len(contents) <= 1:
-        return
-    tail = contents[1:]
-    max_tail = keep_turns * 2
-    if len(tail) <= max_tail:
-        return
-    tail = tail[-max_tail:]
-    contents[:] = [contents[0], *tail]
+    """Keep the initial goal plus the last `keep_turns` model/user exchanges, in place."""
+    excess = len(contents) - 1 - keep_turns * 2
+    if excess > 0:
+        del contents[1 : 1 + excess]
+
+
+def capture_screenshot(page: Page) -> bytes:
+    """Viewport-only JPEG capture – far cheaper to encode and upload than PNG."""
+    return page.screenshot(type="jpeg", quality=SCREENSHOT_QUALITY, full_page=False)
+
+
+def wait_for_settle(page: Page, timeout_ms: int = SETTLE_TIMEOUT_MS) -> None:
+    """Wait briefly for network activity to go quiet instead of sleeping a fixed delay."""
+    try:
+        page.wait_for_load_state("networkidle", timeout=timeout_ms)
+    except PlaywrightError:
+        pass  # Long-polling pages never go idle; the next screenshot shows current state
 
 
 def get_safety_confirmation(safety_decision: Dict[str, Any]) -> str:
@@ -171,21 +208,40 @@ def get_safety_confirmation(safety_decision: Dict[str, Any]) -> str:
     return "CONTINUE" if decision.lower().startswith("y") else "TERMINATE"
 
 
+def stream_function_calls(
+    client: genai.Client,
+    contents: List[Content],
+    config: types.GenerateContentConfig,
+    model_parts: List[Part],
+) -> Iterator[types.FunctionCall]:
+    """Stream one model turn, collecting every part and yielding function calls as they arrive.
+
+    Consuming this lazily lets Playwright act on the first call while the rest of the
+    response is still being generated. Actions run on the caller's thread because the
+    sync Playwright API is bound to the thread that started it.
+    """
+    stream = client.models.generate_content_stream(model=MODEL_ID, contents=contents, config=config)
+    for chunk in stream:
+        if not chunk.candidates or not chunk.candidates[0].content:
+            continue
+        for part in chunk.candidates[0].content.parts or []:
+            model_parts.append(part)
+            if getattr(part, "function_call", None):
+                yield part.function_call
+
+
 def execute_function_calls(
-    candidate: types.Candidate,
+    function_calls: Iterable[types.FunctionCall],
     page: Page,
     screen_width: int,
     screen_height: int,
 ) -> List[Tuple[str, Dict[str, Any]]]:
     """Execute Gemini-generated computer-use function calls via Playwright."""
     results: List[Tuple[str, Dict[str, Any]]] = []
-    function_calls: List[types.FunctionCall] = []
-
-    for part in candidate.content.parts:
-        if getattr(part, "function_call", None):
-            function_calls.append(part.function_call)
+    call_count = 0
 
     for function_call in function_calls:
+        call_count += 1
         name = function_call.name
         args = function_call.args or {}
         print(f" -> Executing: {name} {args}")
@@ -214,8 +270,8 @@ def execute_function_calls(
             elif name == "click_at":
                 x = denormalize_x(args["x"], screen_width)
                 y = denormalize_y(args["y"], screen_height)
+                # Most clicks don't navigate; the settle wait below covers those that do
                 page.mouse.click(x, y)
-                page.wait_for_load_state("load", timeout=5000)
 
             elif name == "type_text_at":
                 x = denormalize_x(args["x"], screen_width)
@@ -225,14 +281,18 @@ def execute_function_calls(
                 clear_before = bool(args.get("clear_before_typing", True))
 
                 page.mouse.click(x, y)
-                if clear_before:
-                    if os.name == "nt":
-                        page.keyboard.press("Control+A")
-                    else:
-                        page.keyboard.press("Meta+A")
-                    page.keyboard.press("Backspace")
-
-                page.keyboard.type(text)
+                # Replacing a text field's value is one evaluate round trip instead of
+                # select-all, backspace and one keypress per character
+                filled = clear_before and page.evaluate(FILL_ACTIVE_ELEMENT_JS, text)
+                if not filled:
+                    if clear_before:
+                        if os.name == "nt":
+                            page.keyboard.press("Control+A")
+                        else:
+                            page.keyboard.press("Meta+A")
+                        page.keyboard.press("Backspace")
+
+                    page.keyboard.type(text)
                 if press_enter:
                     page.keyboard.press("Enter")
 
@@ -279,34 +339,30 @@ def execute_function_calls(
             else:
                 print(f"Warning: Unimplemented function {name}")
 
-            page.wait_for_timeout(500)
+            wait_for_settle(page)
             results.append((name, extra_fields or {}))
 
         except Exception as exc:  # pragma: no cover - runtime safeguard
             print(f"Error executing {name}: {exc}")
             results.append((name, {"error": str(exc), **extra_fields}))
 
-    print(f"[gemini] processed {len(function_calls)} calls, responses {len(results)}")
+    print(f"[gemini] processed {call_count} calls, responses {len(results)}")
     return results
 
 
 def make_function_response_parts(page: Page, exec_results: List[Tuple[str, Dict[str, Any]]]) -> List[Part]:
     """Bundle post-action screenshots for the model to observe the new state."""
-    current_url = page.url
-    parts: List[Part] = []
-
-    for index, (name, result) in enumerate(exec_results):
-        payload = {"url": current_url, **result}
+    if not exec_results:
+        return []
 
-        parts.append(
-            Part(
-                function_response=types.FunctionResponse(
-                    name=name,
-                    response=payload,
-                )
-            )
-        )
+    current_url = page.url
+    function_response = types.FunctionResponse
+    parts: List[Part] = [
+        Part(function_response=function_response(name=name, response={"url": current_url, **result}))
+        for name, result in exec_results
+    ]
 
+    parts.append(Part.from_bytes(data=capture_screenshot(page), mime_type=SCREENSHOT_MIME_TYPE))
     return parts
 
 
@@ -351,34 +407,31 @@ def main() -> None:
             )
             raise SystemExit(1) from exc
 
-        initial_screenshot = page.screenshot(type="png")
+        initial_screenshot = capture_screenshot(page)
 
         contents: List[Content] = [
             Content(
                 role="user",
                 parts=[
                     Part(text=USER_GOAL),
-                    Part.from_bytes(data=initial_screenshot, mime_type="image/png"),
+                    Part.from_bytes(data=initial_screenshot, mime_type=SCREENSHOT_MIME_TYPE),
                 ],
             )
         ]
 
         for turn in range(TURN_LIMIT):
             print(f"\n--- QA Turn {turn + 1} ---")
-            response = client.models.generate_content(model=MODEL_ID, contents=contents, config=config)
-            candidate = response.candidates[0]
-            contents.append(candidate.content)
-
-            has_calls = any(getattr(part, "function_call", None) for part in candidate.content.parts)
-            if not has_calls:
-                text_out = " ".join(
-                    part.text for part in candidate.content.parts if getattr(part, "text", None)
-                )
-                print("QA Agent finished:", text_out)
+            model_parts: List[Part] = []
+            function_calls = stream_function_calls(client, contents, config, model_parts)
+            exec_results = execute_function_calls(function_calls, page, SCREEN_WIDTH, SCREEN_HEIGHT)
+            if any(name == "TERMINATE" for name, _ in exec_results):
                 break
 
-            exec_results = execute_function_calls(candidate, page, SCREEN_WIDTH, SCREEN_HEIGHT)
-            if any(name == "TERMINATE" for name, _ in exec_results):
+            contents.append(Content(role="model", parts=model_parts))
+
+            if not exec_results:
+                text_out = " ".join(part.text for part in model_parts if getattr(part, "text", None))
+                print("QA Agent finished:", text_out)
                 break
 
             response_parts = make_function_response_parts(page, exec_results)
@@ -0,0 +1,40 @@
+"""
+Monthly period helpers shared by the revenue analyses.
+"""
+
+from typing import Any
+
+from sqlalchemy import Label, func
+from sqlalchemy.orm import QueryableAttribute
+
+
+def month_period(column: QueryableAttribute[Any]) -> Label[Any]:
+    """
+    Month bucket of a date column, labelled "period", for SELECT and GROUP BY.
+
+    date_trunc is applied on the SELECT side only: range filters compare the
+    raw column, so they can still use an index on it.
+
+    Args:
+        column: Date or timestamp column
+
+    Returns:
+        Labelled date_trunc('month', column) expression
+    """
+    return func.date_trunc("month", column).label("period")
+
+
+def growth_pct(current: float, previous: float | None) -> float | None:
+    """
+    Period-over-period growth in percent.
+
+    Args:
+        current: This period's value
+        previous: Prior period's value (None for the first period)
+
+    Returns:
+        Growth percentage, or None without a positive previous value
+    """
+    if previous is None or previous <= 0:
+        return None
+    return ((current - previous) / previous) * 100
@@ -5,15 +5,18 @@ Based on financial-analytics skill patterns.
 """
 
 from dataclasses import dataclass
+from datetime import date
 
-import pandas as pd
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from financial_analytics.analytics.periods import growth_pct, month_period
 from financial_analytics.core.config import Settings
 from financial_analytics.db.models import DimCustomer, FactInvoice
 
 
-@dataclass
+@dataclass(slots=True)
 class RevenueTrendData:
     """Revenue trend by period."""
 
@@ -42,61 +45,41 @@ def analyze_revenue_trends(
         List of revenue trends by period
     """
     period_months = months if months is not None else settings.analysis_months
-
-    # Query invoices
-    query = session.query(
-        FactInvoice.customer_id,
-        FactInvoice.amount,
-        FactInvoice.tran_date,
+    cutoff_date = date.today() - relativedelta(months=period_months)
+
+    # Aggregate by month in the database (one row per period); the tran_date
+    # range filter can use ix_fact_invoices_tran_date_customer_id
+    period = month_period(FactInvoice.tran_date)
+    query = (
+        session.query(
+            period,
+            func.sum(FactInvoice.amount).label("total_revenue"),
+            func.count(FactInvoice.amount).label("invoice_count"),
+            func.avg(FactInvoice.amount).label("avg_invoice_size"),
+            func.count(func.distinct(FactInvoice.customer_id)).label("unique_customers"),
+        )
+        .filter(FactInvoice.tran_date >= cutoff_date)
+        .group_by(period)
+        .order_by(period)
     )
 
-    df = pd.read_sql(query.statement, session.bind)
-
-    if df.empty:
-        return []
-
-    # Convert date and filter to period
-    df["tran_date"] = pd.to_datetime(df["tran_date"])
-    cutoff_date = pd.Timestamp.now() - pd.DateOffset(months=period_months)
-    df = df[df["tran_date"] >= cutoff_date]
-
-    # Extract period (YYYY-MM)
-    df["period"] = df["tran_date"].dt.to_period("M").astype(str)
-
-    # Aggregate by period
-    aggregated = df.groupby("period").agg({
-        "amount": ["sum", "count", "mean"],
-        "customer_id": "nunique",
-    })
-
-    results: list[RevenueTrendData] = []
-    prev_revenue = None
-
-    for period, row in aggregated.iterrows():
-        total_revenue = float(row[("amount", "sum")])
-
-        # Calculate growth
-        growth_pct = None
-        if prev_revenue is not None and prev_revenue > 0:
-            growth_pct = ((total_revenue - prev_revenue) / prev_revenue) * 100
-
-        results.append(
-            RevenueTrendData(
-                period=str(period),
-                total_revenue=total_revenue,
-                invoice_count=int(row[("amount", "count")]),
-                avg_invoice_size=float(row[("amount", "mean")]),
-                unique_customers=int(row[("customer_id", "nunique")]),
-                revenue_growth_pct=growth_pct,
-            )
+    rows = query.all()
+    revenues = [float(row.total_revenue) for row in rows]
+
+    return [
+        RevenueTrendData(
+            period=row.period.strftime("%Y-%m"),
+            total_revenue=revenues[i],
+            invoice_count=int(row.invoice_count),
+            avg_invoice_size=float(row.avg_invoice_size),
+            unique_customers=int(row.unique_customers),
+            revenue_growth_pct=growth_pct(revenues[i], revenues[i - 1] if i else None),
         )
+        for i, row in enumerate(rows)
+    ]
 
-        prev_revenue = total_revenue
-
-    return results
 
-
-@dataclass
+@dataclass(slots=True)
 class CustomerLifetimeValue:
     """Customer lifetime value metrics."""
 
@@ -120,46 +103,44 @@ def calculate_customer_ltv(session: Session) -> list[CustomerLifetimeValue]:
     Returns:
         List of customer LTV metrics sorted by total revenue
     """
-    query = session.query(
-        DimCustomer.id,
-        DimCustomer.company_name,
-        FactInvoice.amount,
-        FactInvoice.tran_date,
-    ).join(FactInvoice, DimCustomer.id == FactInvoice.customer_id)
-
-    df = pd.read_sql(query.statement, session.bind)
-
-    if df.empty:
-        return []
-
-    df["tran_date"] = pd.to_datetime(df["tran_date"])
-
-    # Aggregate by customer
-    aggregated = df.groupby(["id", "company_name"]).agg({
-        "amount": ["sum", "count", "mean"],
-        "tran_date": ["min", "max"],
-    })
-
-    results: list[CustomerLifetimeValue] = []
-    now = pd.Timestamp.now()
-
-    for (customer_id, company_name), row in aggregated.iterrows():
-        last_purchase = pd.to_datetime(row[("tran_date", "max")])
-        days_since = (now - last_purchase).days if last_purchase else None
-
-        results.append(
-            CustomerLifetimeValue(
-                customer_id=str(customer_id),
-                company_name=str(company_name),
-                total_revenue=float(row[("amount", "sum")]),
-                invoice_count=int(row[("amount", "count")]),
-                avg_order_value=float(row[("amount", "mean")]),
-                first_purchase=str(row[("tran_date", "min")]),
-                last_purchase=str(row[("tran_date", "max")]),
-                days_since_last_purchase=days_since,
-            )
+    # Aggregate by customer in the database, largest revenue first
+    total_revenue = func.sum(FactInvoice.amount)
+    query = (
+        session.query(
+            DimCustomer.id,
+            DimCustomer.company_name,
+            total_revenue,
+            func.count(FactInvoice.amount),
+            func.avg(FactInvoice.amount),
+            func.min(FactInvoice.tran_date),
+            func.max(FactInvoice.tran_date),
         )
+        .join(FactInvoice, DimCustomer.id == FactInvoice.customer_id)
+        .group_by(DimCustomer.id, DimCustomer.company_name)
+        .order_by(total_revenue.desc())
+        .yield_per(1000)
+    )
 
-    # Sort by total revenue descending
-    results.sort(key=lambda x: x.total_revenue, reverse=True)
-    return results
+    today = date.today()
+
+    return [
+        CustomerLifetimeValue(
+            customer_id=str(customer_id),
+            company_name=str(company_name),
+            total_revenue=float(revenue_sum),
+            invoice_count=int(invoice_count),
+            avg_order_value=float(avg_order),
+            first_purchase=str(first_purchase),
+            last_purchase=str(last_purchase),
+            days_since_last_purchase=(today - last_purchase).days if last_purchase else None,
+        )
+        for (
+            customer_id,
+            company_name,
+            revenue_sum,
+            invoice_count,
+            avg_order,
+            first_purchase,
+            last_purchase,
+        ) in query
+    ]
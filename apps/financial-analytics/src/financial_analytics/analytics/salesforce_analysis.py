@@ -5,13 +5,72 @@ Based on financial-analytics Salesforce integration patterns.
 """
 
 from dataclasses import dataclass
+from datetime import date
 from typing import Any
 
-import pandas as pd
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.orm import Session
 
+from financial_analytics.analytics.periods import growth_pct, month_period
 from financial_analytics.db.models import SalesforceOpportunity
 
+# Statements are built once at import; SQLAlchemy's compiled cache reuses them.
+# Open pipeline by stage, largest weighted amount first. NULL amounts or
+# probabilities drop out of the weighted sum (counted as 0), and the percent
+# scaling is applied once per group rather than per row.
+_WEIGHTED_AMOUNT = func.coalesce(
+    func.sum(SalesforceOpportunity.amount * SalesforceOpportunity.probability) / 100.0, 0.0
+)
+_PIPELINE_STMT = (
+    select(
+        SalesforceOpportunity.stage_name,
+        func.count(SalesforceOpportunity.amount),
+        func.sum(SalesforceOpportunity.amount),
+        _WEIGHTED_AMOUNT,
+        func.avg(SalesforceOpportunity.amount),
+        func.avg(SalesforceOpportunity.probability),
+    )
+    .where(SalesforceOpportunity.is_closed == False)  # noqa: E712
+    .group_by(SalesforceOpportunity.stage_name)
+    .order_by(_WEIGHTED_AMOUNT.desc())
+)
+
+# Won deals by month since :cutoff_date (one row per period)
+_PERIOD = month_period(SalesforceOpportunity.close_date)
+_CLOSED_WON_STMT = (
+    select(
+        _PERIOD,
+        func.sum(SalesforceOpportunity.amount).label("total_revenue"),
+        func.count(SalesforceOpportunity.amount).label("deal_count"),
+        func.avg(SalesforceOpportunity.amount).label("avg_deal_size"),
+        func.count(func.distinct(SalesforceOpportunity.account_name)).label("unique_accounts"),
+    )
+    .where(
+        SalesforceOpportunity.is_won == True,  # noqa: E712
+        SalesforceOpportunity.close_date >= bindparam("cutoff_date"),
+    )
+    .group_by(_PERIOD)
+    .order_by(_PERIOD)
+)
+
+# Won revenue by industry, largest first
+_INDUSTRY_REVENUE = func.sum(SalesforceOpportunity.amount)
+_INDUSTRY_STMT = (
+    select(
+        SalesforceOpportunity.industry,
+        func.count(SalesforceOpportunity.amount),
+        _INDUSTRY_REVENUE,
+        func.avg(SalesforceOpportunity.amount),
+    )
+    .where(
+        SalesforceOpportunity.is_won == True,  # noqa: E712
+        SalesforceOpportunity.industry.isnot(None),
+    )
+    .group_by(SalesforceOpportunity.industry)
+    .order_by(_INDUSTRY_REVENUE.desc())
+)
+
 
 @dataclass
 class RevenuePipelineData:
@@ -45,45 +104,26 @@ def analyze_revenue_pipeline(session: Session) -> list[RevenuePipelineData]:
     Returns:
         Pipeline metrics by stage
     """
-    query = session.query(
-        SalesforceOpportunity.stage_name,
-        SalesforceOpportunity.amount,
-        SalesforceOpportunity.probability,
-        SalesforceOpportunity.is_closed,
-    ).filter(SalesforceOpportunity.is_closed == False)  # noqa: E712
-
-    df = pd.read_sql(query.statement, session.bind)
-
-    if df.empty:
-        return []
-
-    # Calculate weighted amount
-    df["weighted_amount"] = df["amount"].fillna(0) * (df["probability"].fillna(0) / 100.0)
-
-    # Aggregate by stage
-    aggregated = df.groupby("stage_name").agg({
-        "amount": ["count", "sum", "mean"],
-        "weighted_amount": "sum",
-        "probability": "mean",
-    })
-
-    results: list[RevenuePipelineData] = []
-
-    for stage_name, row in aggregated.iterrows():
-        results.append(
-            RevenuePipelineData(
-                stage_name=str(stage_name),
-                opportunity_count=int(row[("amount", "count")]),
-                total_amount=float(row[("amount", "sum")]),
-                weighted_amount=float(row[("weighted_amount", "sum")]),
-                avg_deal_size=float(row[("amount", "mean")]),
-                win_probability=float(row[("probability", "mean")]),
-            )
+    rows = session.execute(_PIPELINE_STMT)
+
+    return [
+        RevenuePipelineData(
+            stage_name=str(stage_name),
+            opportunity_count=int(opportunity_count),
+            total_amount=float(total_amount or 0.0),
+            weighted_amount=float(weighted),
+            avg_deal_size=float(avg_deal_size or 0.0),
+            win_probability=float(win_probability or 0.0),
         )
-
-    # Sort by weighted amount descending
-    results.sort(key=lambda x: x.weighted_amount, reverse=True)
-    return results
+        for (
+            stage_name,
+            opportunity_count,
+            total_amount,
+            weighted,
+            avg_deal_size,
+            win_probability,
+        ) in rows
+    ]
 
 
 def analyze_closed_won_revenue(
@@ -100,52 +140,27 @@ def analyze_closed_won_revenue(
     Returns:
         Monthly revenue metrics
     """
-    query = session.query(
-        SalesforceOpportunity.close_date,
-        SalesforceOpportunity.amount,
-        SalesforceOpportunity.account_name,
-    ).filter(SalesforceOpportunity.is_won == True)  # noqa: E712
+    # Window starts on the first day of the month `months` back
+    cutoff_date = date.today().replace(day=1) - relativedelta(months=months)
 
-    df = pd.read_sql(query.statement, session.bind)
+    rows = session.execute(_CLOSED_WON_STMT, {"cutoff_date": cutoff_date})
 
-    if df.empty:
-        return []
+    results: list[dict[str, Any]] = []
+    previous_revenue: float | None = None
 
-    # Convert date and filter to period
-    df["close_date"] = pd.to_datetime(df["close_date"])
-    cutoff_date = pd.Timestamp.now() - pd.DateOffset(months=months)
-    df = df[df["close_date"] >= cutoff_date]
-
-    # Extract period (YYYY-MM)
-    df["period"] = df["close_date"].dt.to_period("M").astype(str)
-
-    # Aggregate by period
-    aggregated = df.groupby("period").agg({
-        "amount": ["sum", "count", "mean"],
-        "account_name": "nunique",
-    })
-
-    results = []
-    prev_revenue = None
-
-    for period, row in aggregated.iterrows():
-        total_revenue = float(row[("amount", "sum")])
-
-        # Calculate growth
-        growth_pct = None
-        if prev_revenue is not None and prev_revenue > 0:
-            growth_pct = ((total_revenue - prev_revenue) / prev_revenue) * 100
-
-        results.append({
-            "period": str(period),
-            "total_revenue": total_revenue,
-            "deal_count": int(row[("amount", "count")]),
-            "avg_deal_size": float(row[("amount", "mean")]),
-            "unique_accounts": int(row[("account_name", "nunique")]),
-            "revenue_growth_pct": growth_pct,
-        })
-
-        prev_revenue = total_revenue
+    for row in rows:
+        total_revenue = float(row.total_revenue or 0.0)
+        results.append(
+            {
+                "period": row.period.strftime("%Y-%m"),
+                "total_revenue": total_revenue,
+                "deal_count": int(row.deal_count),
+                "avg_deal_size": float(row.avg_deal_size or 0.0),
+                "unique_accounts": int(row.unique_accounts),
+                "revenue_growth_pct": growth_pct(total_revenue, previous_revenue),
+            }
+        )
+        previous_revenue = total_revenue
 
     return results
 
@@ -160,36 +175,14 @@ def analyze_by_industry(session: Session) -> list[ProductRevenueData]:
     Returns:
         Revenue breakdown by industry
     """
-    query = session.query(
-        SalesforceOpportunity.industry,
-        SalesforceOpportunity.amount,
-    ).filter(
-        SalesforceOpportunity.is_won == True,  # noqa: E712
-        SalesforceOpportunity.industry.isnot(None),
-    )
-
-    df = pd.read_sql(query.statement, session.bind)
-
-    if df.empty:
-        return []
-
-    # Aggregate by industry
-    aggregated = df.groupby("industry").agg({
-        "amount": ["count", "sum", "mean"],
-    })
-
-    results: list[ProductRevenueData] = []
-
-    for industry, row in aggregated.iterrows():
-        results.append(
-            ProductRevenueData(
-                industry=str(industry),
-                opportunity_count=int(row[("amount", "count")]),
-                total_revenue=float(row[("amount", "sum")]),
-                avg_deal_size=float(row[("amount", "mean")]),
-            )
+    rows = session.execute(_INDUSTRY_STMT)
+
+    return [
+        ProductRevenueData(
+            industry=str(industry),
+            opportunity_count=int(opportunity_count),
+            total_revenue=float(revenue_sum or 0.0),
+            avg_deal_size=float(avg_deal_size or 0.0),
         )
-
-    # Sort by total revenue descending
-    results.sort(key=lambda x: x.total_revenue, reverse=True)
-    return results
+        for industry, opportunity_count, revenue_sum, avg_deal_size in rows
+    ]
@@ -4,15 +4,42 @@ Vendor spend analysis engine.
 Based on financial-analytics and vendor-cost-analytics skill patterns.
 """
 
+import re
+from collections import defaultdict
 from dataclasses import dataclass
-from difflib import SequenceMatcher
+from functools import lru_cache
 
-import pandas as pd
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from financial_analytics.core.config import Settings
 from financial_analytics.db.models import DimVendor, FactVendorBill
 
+# Statements are built once at import; SQLAlchemy's compiled cache reuses them.
+# Per-vendor spend aggregated in the database, largest spend first
+_TOTAL_SPEND = func.sum(FactVendorBill.amount)
+_VENDOR_SPEND_STMT = (
+    select(
+        DimVendor.id,
+        DimVendor.company_name,
+        _TOTAL_SPEND,
+        func.count(FactVendorBill.amount),
+        func.avg(FactVendorBill.amount),
+        func.min(FactVendorBill.tran_date),
+        func.max(FactVendorBill.tran_date),
+    )
+    .join(FactVendorBill, DimVendor.id == FactVendorBill.vendor_id)
+    .group_by(DimVendor.id, DimVendor.company_name)
+    .order_by(_TOTAL_SPEND.desc())
+)
+
+# Only id and name are needed for matching: plain rows streamed in batches
+_VENDOR_NAMES_STMT = select(DimVendor.id, DimVendor.company_name).execution_options(
+    yield_per=10_000
+)
+
 
 @dataclass
 class VendorSpendSummary:
@@ -38,53 +65,46 @@ class DuplicatePair:
     similarity: float
 
 
-def analyze_vendor_spend(session: Session, settings: Settings) -> list[VendorSpendSummary]:
+def analyze_vendor_spend(
+    session: Session,
+    settings: Settings,
+    limit: int | None = None,
+) -> list[VendorSpendSummary]:
     """
     Analyze vendor spend from database.
 
     Args:
         session: Database session
         settings: Application settings
+        limit: Only return the top vendors by spend (all vendors if None)
 
     Returns:
         List of vendor spend summaries sorted by total spend
     """
-    # Query vendor bills
-    query = session.query(
-        DimVendor.id,
-        DimVendor.company_name,
-        FactVendorBill.amount,
-        FactVendorBill.tran_date,
-    ).join(FactVendorBill, DimVendor.id == FactVendorBill.vendor_id)
-
-    df = pd.read_sql(query.statement, session.bind)
-
-    if df.empty:
-        return []
-
-    # Aggregate by vendor
-    aggregated = df.groupby(["id", "company_name"]).agg({
-        "amount": ["sum", "count", "mean"],
-        "tran_date": ["min", "max"],
-    })
-
-    results: list[VendorSpendSummary] = []
-    for (vendor_id, company_name), row in aggregated.iterrows():
-        results.append(
-            VendorSpendSummary(
-                vendor_id=str(vendor_id),
-                company_name=str(company_name),
-                total_spend=float(row[("amount", "sum")]),
-                transaction_count=int(row[("amount", "count")]),
-                avg_transaction=float(row[("amount", "mean")]),
-                first_transaction=str(row[("tran_date", "min")]),
-                last_transaction=str(row[("tran_date", "max")]),
-            )
+    # LIMIT is applied after ORDER BY in the database, so only top rows are fetched
+    stmt = _VENDOR_SPEND_STMT if limit is None else _VENDOR_SPEND_STMT.limit(limit)
+    rows = session.execute(stmt)
+
+    return [
+        VendorSpendSummary(
+            vendor_id=str(vendor_id),
+            company_name=str(company_name),
+            total_spend=float(spend_sum),
+            transaction_count=int(transaction_count),
+            avg_transaction=float(avg_transaction),
+            first_transaction=str(first_transaction),
+            last_transaction=str(last_transaction),
         )
-
-    # Sort by total spend descending
-    results.sort(key=lambda x: x.total_spend, reverse=True)
-    return results
+        for (
+            vendor_id,
+            company_name,
+            spend_sum,
+            transaction_count,
+            avg_transaction,
+            first_transaction,
+            last_transaction,
+        ) in rows
+    ]
 
 
 def get_top_vendors(
@@ -103,23 +123,84 @@ def get_top_vendors(
     Returns:
         List of top vendors by spend
     """
-    all_vendors = analyze_vendor_spend(session, settings)
     limit = top_n if top_n is not None else settings.top_n_vendors
-    return all_vendors[:limit]
+    return analyze_vendor_spend(session, settings, limit=limit)
 
 
 def calculate_similarity(name1: str, name2: str) -> float:
     """
     Calculate similarity between two vendor names.
 
+    Token-set matching: names are normalized (lowercase, punctuation to
+    spaces) and compared as word sets, so "ACME Corp." matches "Acme Corp".
+    A name whose words are all contained in the other scores 1.0 ("Acme" vs
+    "Acme Holdings"), so scores run higher than the character-level ratio
+    used before and duplicate_threshold may need raising.
+
     Args:
         name1: First vendor name
         name2: Second vendor name
 
     Returns:
-        Similarity score between 0.0 and 1.0
+        Similarity score between 0.0 and 1.0 (1.0 for two names that are
+        both empty after normalization, 0.0 if only one is)
     """
-    return SequenceMatcher(None, name1.lower(), name2.lower()).ratio()
+    # Symmetric metric: order the pair so (a, b) and (b, a) share a cache slot
+    normalized1, normalized2 = default_process(name1), default_process(name2)
+    if not normalized1 and not normalized2:
+        # token_set_ratio scores this 0; identical (empty) names are a match
+        return 1.0
+    return _cached_similarity(*sorted((normalized1, normalized2)))
+
+
+@lru_cache(maxsize=100_000)
+def _cached_similarity(name1: str, name2: str) -> float:
+    """Similarity of two already-normalized names."""
+    return fuzz.token_set_ratio(name1, name2) / 100.0
+
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]")
+
+
+def _blocking_key(name: str) -> str:
+    """First three alphanumeric characters of an already-normalized name."""
+    return _NON_ALNUM.sub("", name)[:3]
+
+
+def _score_block(
+    names: list[str],
+    members: list[int],
+    score_cutoff: float,
+) -> list[tuple[int, int, float]]:
+    """
+    Score all pairs within one block.
+
+    Args:
+        names: All vendor names, normalized with default_process
+        members: Ascending indices into names belonging to this block
+        score_cutoff: Minimum score (0-100) to report
+
+    Returns:
+        (index1, index2, score) for each pair at or above the cutoff, index1 < index2
+    """
+    block_names = [names[i] for i in members]
+
+    pairs: list[tuple[int, int, float]] = []
+    for a, name in enumerate(block_names[:-1]):
+        # Each name against the ones after it; score_cutoff lets RapidFuzz
+        # abandon a comparison once it can't reach the cutoff
+        matches = process.extract(
+            name,
+            block_names[a + 1 :],
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=score_cutoff,
+            limit=None,
+        )
+        pairs.extend(
+            (members[a], members[a + 1 + offset], float(score)) for _, score, offset in matches
+        )
+
+    return pairs
 
 
 def detect_duplicate_vendors(
@@ -130,6 +211,9 @@ def detect_duplicate_vendors(
     """
     Detect potential duplicate vendors using fuzzy matching.
 
+    Pairs are scored as in calculate_similarity. Names with no letters or
+    digits are not matched at all: they carry nothing to compare.
+
     Args:
         session: Database session
         settings: Application settings
@@ -140,26 +224,36 @@ def detect_duplicate_vendors(
     """
     similarity_threshold = threshold if threshold is not None else settings.duplicate_threshold
 
-    # Get all vendors
-    vendors = session.query(DimVendor).all()
-
-    duplicates: list[DuplicatePair] = []
-
-    # Pairwise comparison
-    for i, vendor1 in enumerate(vendors):
-        for vendor2 in vendors[i + 1 :]:
-            similarity = calculate_similarity(vendor1.company_name, vendor2.company_name)
-
-            if similarity >= similarity_threshold:
-                duplicates.append(
-                    DuplicatePair(
-                        vendor1_id=vendor1.id,
-                        vendor1_name=vendor1.company_name,
-                        vendor2_id=vendor2.id,
-                        vendor2_name=vendor2.company_name,
-                        similarity=similarity,
-                    )
-                )
+    ids: list[str] = []
+    names: list[str] = []
+    for vendor_id, company_name in session.execute(_VENDOR_NAMES_STMT):
+        ids.append(vendor_id)
+        names.append(company_name)
+    score_cutoff = similarity_threshold * 100
+
+    # Normalize once per vendor rather than once per comparison
+    normalized = [default_process(name) for name in names]
+
+    # Blocking: only names sharing a key are scored against each other
+    blocks: dict[str, list[int]] = defaultdict(list)
+    for index, name in enumerate(normalized):
+        if name:
+            blocks[_blocking_key(name)].append(index)
+
+    # process.extract holds the GIL for each call, so blocks are scored one
+    # after another; a thread pool over them measured no faster
+    duplicates = [
+        DuplicatePair(
+            vendor1_id=ids[i],
+            vendor1_name=names[i],
+            vendor2_id=ids[j],
+            vendor2_name=names[j],
+            similarity=similarity / 100.0,
+        )
+        for members in blocks.values()
+        if len(members) > 1
+        for i, j, similarity in _score_block(normalized, members, score_cutoff)
+    ]
 
     # Sort by similarity descending
     duplicates.sort(key=lambda x: x.similarity, reverse=True)
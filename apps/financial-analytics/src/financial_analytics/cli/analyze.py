@@ -4,29 +4,44 @@ Financial analysis commands.
 Following python-cli-engineering patterns with Rich output.
 """
 
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
 import typer
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
+
+if TYPE_CHECKING:
+    from financial_analytics.cli.context import AppContext
+
+# Data tables: cells are pre-formatted, so skip Rich's repr highlighting
+console = Console(highlight=False)
+
+
+def _money(value: float) -> str:
+    """Format a currency amount for a table cell."""
+    return f"${value:,.2f}"
+
 
-from financial_analytics.analytics.revenue_analysis import (
-    analyze_revenue_trends,
-    calculate_customer_ltv,
-)
-from financial_analytics.analytics.salesforce_analysis import (
-    analyze_by_industry,
-    analyze_revenue_pipeline,
-)
-from financial_analytics.analytics.vendor_analysis import (
-    detect_duplicate_vendors,
-    get_top_vendors,
-)
-from financial_analytics.core.config import Settings
-from financial_analytics.db.session import get_session
+def _growth(pct: float | None) -> str:
+    """Format period-over-period growth, N/A when undefined."""
+    return f"{pct:+.1f}%" if pct is not None else "N/A"
 
-console = Console()
+
+def _add_rows(table: Table, rows: Iterable[tuple[str, ...]]) -> None:
+    """
+    Add pre-formatted rows to a table.
+
+    Cells are wrapped as plain Text so Rich doesn't parse markup or highlight
+    each one (which also keeps names containing "[...]" intact).
+    """
+    for row in rows:
+        table.add_row(*map(Text, row))
 
 
 def analyze_command(
+    ctx: typer.Context,
     months: int = typer.Option(12, "--months", "-m", help="Analysis period in months"),
 ) -> None:
     """
@@ -34,10 +49,13 @@ def analyze_command(
 
     Analyzes vendors, revenue, and displays key metrics.
     """
+    from financial_analytics.analytics.revenue_analysis import analyze_revenue_trends
+    from financial_analytics.analytics.vendor_analysis import get_top_vendors
+
     console.print(f"[cyan]Running financial analysis ({months} months)[/cyan]\n")
 
-    settings = Settings()  # type: ignore[call-arg]  # Reads from .env at runtime  # type: ignore[call-arg]  # Reads from .env at runtime
-    session = get_session(settings)
+    app_context: AppContext = ctx.obj
+    settings, session = app_context.settings, app_context.session
 
     # Vendor analysis
     console.print("[yellow]Top Vendors by Spend:[/yellow]")
@@ -50,13 +68,18 @@ def analyze_command(
         table.add_column("Total Spend", justify="right", style="green")
         table.add_column("Transactions", justify="right")
 
-        for idx, vendor in enumerate(vendors, 1):
-            table.add_row(
-                str(idx),
-                vendor.company_name,
-                f"${vendor.total_spend:,.2f}",
-                str(vendor.transaction_count),
-            )
+        _add_rows(
+            table,
+            (
+                (
+                    str(idx),
+                    vendor.company_name,
+                    _money(vendor.total_spend),
+                    str(vendor.transaction_count),
+                )
+                for idx, vendor in enumerate(vendors, 1)
+            ),
+        )
 
         console.print(table)
     else:
@@ -73,35 +96,39 @@ def analyze_command(
         table.add_column("Invoices", justify="right")
         table.add_column("Growth", justify="right")
 
-        for trend in trends[-12:]:  # Last 12 months
-            growth_str = (
-                f"{trend.revenue_growth_pct:+.1f}%"
-                if trend.revenue_growth_pct is not None
-                else "N/A"
-            )
-            table.add_row(
-                trend.period,
-                f"${trend.total_revenue:,.2f}",
-                str(trend.invoice_count),
-                growth_str,
-            )
+        _add_rows(
+            table,
+            (
+                (
+                    trend.period,
+                    _money(trend.total_revenue),
+                    str(trend.invoice_count),
+                    _growth(trend.revenue_growth_pct),
+                )
+                for trend in trends[-12:]  # Last 12 months
+            ),
+        )
 
         console.print(table)
     else:
         console.print("[red]No revenue data available[/red]")
 
-    session.close()
-
 
 def vendors_command(
+    ctx: typer.Context,
     top: int = typer.Option(25, "--top", "-n", help="Number of top vendors to display"),
     duplicates: bool = typer.Option(False, "--duplicates", help="Show duplicate vendors"),
 ) -> None:
     """
     Analyze vendor spend and detect duplicates.
     """
-    settings = Settings()  # type: ignore[call-arg]  # Reads from .env at runtime
-    session = get_session(settings)
+    from financial_analytics.analytics.vendor_analysis import (
+        detect_duplicate_vendors,
+        get_top_vendors,
+    )
+
+    app_context: AppContext = ctx.obj
+    settings, session = app_context.settings, app_context.session
 
     if duplicates:
         console.print("[yellow]Detecting duplicate vendors...[/yellow]\n")
@@ -113,12 +140,17 @@ def vendors_command(
             table.add_column("Vendor 2", style="magenta")
             table.add_column("Similarity", justify="right", style="yellow")
 
-            for pair in pairs[:20]:  # Top 20 duplicates
-                table.add_row(
-                    pair.vendor1_name,
-                    pair.vendor2_name,
-                    f"{pair.similarity * 100:.1f}%",
-                )
+            _add_rows(
+                table,
+                (
+                    (
+                        pair.vendor1_name,
+                        pair.vendor2_name,
+                        f"{pair.similarity * 100:.1f}%",
+                    )
+                    for pair in pairs[:20]  # Top 20 duplicates
+                ),
+            )
 
             console.print(table)
         else:
@@ -135,31 +167,40 @@ def vendors_command(
             table.add_column("Transactions", justify="right")
             table.add_column("Avg Transaction", justify="right")
 
-            for idx, vendor in enumerate(vendors, 1):
-                table.add_row(
-                    str(idx),
-                    vendor.company_name,
-                    f"${vendor.total_spend:,.2f}",
-                    str(vendor.transaction_count),
-                    f"${vendor.avg_transaction:,.2f}",
-                )
+            _add_rows(
+                table,
+                (
+                    (
+                        str(idx),
+                        vendor.company_name,
+                        _money(vendor.total_spend),
+                        str(vendor.transaction_count),
+                        _money(vendor.avg_transaction),
+                    )
+                    for idx, vendor in enumerate(vendors, 1)
+                ),
+            )
 
             console.print(table)
         else:
             console.print("[red]No vendor data available[/red]")
 
-    session.close()
-
 
 def revenue_command(
+    ctx: typer.Context,
     months: int = typer.Option(12, "--months", "-m", help="Analysis period in months"),
     ltv: bool = typer.Option(False, "--ltv", help="Show customer lifetime value"),
 ) -> None:
     """
     Analyze revenue trends and customer value.
     """
-    settings = Settings()  # type: ignore[call-arg]  # Reads from .env at runtime
-    session = get_session(settings)
+    from financial_analytics.analytics.revenue_analysis import (
+        analyze_revenue_trends,
+        calculate_customer_ltv,
+    )
+
+    app_context: AppContext = ctx.obj
+    settings, session = app_context.settings, app_context.session
 
     if ltv:
         console.print("[yellow]Customer Lifetime Value:[/yellow]\n")
@@ -173,14 +214,19 @@ def revenue_command(
             table.add_column("Orders", justify="right")
             table.add_column("Avg Order", justify="right")
 
-            for idx, customer in enumerate(customers[:25], 1):
-                table.add_row(
-                    str(idx),
-                    customer.company_name,
-                    f"${customer.total_revenue:,.2f}",
-                    str(customer.invoice_count),
-                    f"${customer.avg_order_value:,.2f}",
-                )
+            _add_rows(
+                table,
+                (
+                    (
+                        str(idx),
+                        customer.company_name,
+                        _money(customer.total_revenue),
+                        str(customer.invoice_count),
+                        _money(customer.avg_order_value),
+                    )
+                    for idx, customer in enumerate(customers[:25], 1)
+                ),
+            )
 
             console.print(table)
         else:
@@ -197,28 +243,27 @@ def revenue_command(
             table.add_column("Avg Invoice", justify="right")
             table.add_column("Growth", justify="right")
 
-            for trend in trends:
-                growth_str = (
-                    f"{trend.revenue_growth_pct:+.1f}%"
-                    if trend.revenue_growth_pct is not None
-                    else "N/A"
-                )
-                table.add_row(
-                    trend.period,
-                    f"${trend.total_revenue:,.2f}",
-                    str(trend.invoice_count),
-                    f"${trend.avg_invoice_size:,.2f}",
-                    growth_str,
-                )
+            _add_rows(
+                table,
+                (
+                    (
+                        trend.period,
+                        _money(trend.total_revenue),
+                        str(trend.invoice_count),
+                        _money(trend.avg_invoice_size),
+                        _growth(trend.revenue_growth_pct),
+                    )
+                    for trend in trends
+                ),
+            )
 
             console.print(table)
         else:
             console.print("[red]No revenue data available[/red]")
 
-    session.close()
-
 
 def pipeline_command(
+    ctx: typer.Context,
     by_industry: bool = typer.Option(False, "--by-industry", help="Show revenue by industry"),
 ) -> None:
     """
@@ -226,14 +271,20 @@ def pipeline_command(
 
     Requires Salesforce sync to be enabled and data synced.
     """
-    settings = Settings()  # type: ignore[call-arg]  # Reads from .env at runtime
+    from financial_analytics.analytics.salesforce_analysis import (
+        analyze_by_industry,
+        analyze_revenue_pipeline,
+    )
+
+    app_context: AppContext = ctx.obj
+    settings = app_context.settings
 
     if not settings.sf_enabled:
         console.print("[red]Salesforce integration is not enabled[/red]")
         console.print("Set SF_ENABLED=true in .env to enable Salesforce integration")
         raise typer.Exit(code=1)
 
-    session = get_session(settings)
+    session = app_context.session
 
     if by_industry:
         console.print("[yellow]Revenue by Industry:[/yellow]\n")
@@ -247,14 +298,19 @@ def pipeline_command(
             table.add_column("Deals", justify="right")
             table.add_column("Avg Deal Size", justify="right")
 
-            for idx, industry in enumerate(industries, 1):
-                table.add_row(
-                    str(idx),
-                    industry.industry,
-                    f"${industry.total_revenue:,.2f}",
-                    str(industry.opportunity_count),
-                    f"${industry.avg_deal_size:,.2f}",
-                )
+            _add_rows(
+                table,
+                (
+                    (
+                        str(idx),
+                        industry.industry,
+                        _money(industry.total_revenue),
+                        str(industry.opportunity_count),
+                        _money(industry.avg_deal_size),
+                    )
+                    for idx, industry in enumerate(industries, 1)
+                ),
+            )
 
             console.print(table)
         else:
@@ -272,15 +328,20 @@ def pipeline_command(
             table.add_column("Avg Deal", justify="right")
             table.add_column("Win Prob", justify="right")
 
-            for stage in pipeline:
-                table.add_row(
-                    stage.stage_name,
-                    str(stage.opportunity_count),
-                    f"${stage.total_amount:,.2f}",
-                    f"${stage.weighted_amount:,.2f}",
-                    f"${stage.avg_deal_size:,.2f}",
-                    f"{stage.win_probability:.1f}%",
-                )
+            _add_rows(
+                table,
+                (
+                    (
+                        stage.stage_name,
+                        str(stage.opportunity_count),
+                        _money(stage.total_amount),
+                        _money(stage.weighted_amount),
+                        _money(stage.avg_deal_size),
+                        f"{stage.win_probability:.1f}%",
+                    )
+                    for stage in pipeline
+                ),
+            )
 
             console.print(table)
 
@@ -292,5 +353,3 @@ def pipeline_command(
         else:
             console.print("[red]No pipeline data available[/red]")
             console.print("Run 'fin-analytics sync --salesforce-only' to fetch Salesforce data")
-
-    session.close()
@@ -0,0 +1,40 @@
+"""
+Shared command context.
+
+One settings object and one database session per CLI invocation, created on
+first use so commands that never touch the database (and --help) stay cheap.
+"""
+
+from typing import TYPE_CHECKING
+
+from financial_analytics.core.config import Settings, get_settings
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+
+class AppContext:
+    """Lazily built settings and session, stored on the Typer context."""
+
+    def __init__(self) -> None:
+        self._session: Session | None = None
+
+    @property
+    def settings(self) -> Settings:
+        """Application settings (cached process-wide)."""
+        return get_settings()
+
+    @property
+    def session(self) -> "Session":
+        """Database session shared by everything the command runs."""
+        if self._session is None:
+            from financial_analytics.db.session import get_session
+
+            self._session = get_session(self.settings)
+        return self._session
+
+    def close(self) -> None:
+        """Close the session if one was opened."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
@@ -8,8 +8,7 @@ import typer
 from rich.console import Console
 from rich.panel import Panel
 
-from financial_analytics.core.config import Settings, get_logger
-from financial_analytics.db.session import init_database
+from financial_analytics.core.config import get_logger, get_settings
 
 console = Console()
 
@@ -22,13 +21,15 @@ def init_command(
 
     Creates all tables if they don't exist. Safe to run multiple times.
     """
+    from financial_analytics.db.session import init_database
+
     logger = get_logger()
     logger.info(f"Command: init (force={force})")
 
     console.print(Panel("[cyan]Initializing Database Schema[/cyan]"))
 
     try:
-        settings = Settings()  # type: ignore[call-arg]  # Reads from .env at runtime
+        settings = get_settings()
     except Exception as e:
         logger.error(f"Configuration error: {e}")
         console.print(f"[red]Configuration error: {e}[/red]")
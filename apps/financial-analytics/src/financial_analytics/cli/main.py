@@ -14,6 +14,7 @@ from financial_analytics.cli.analyze import (
     revenue_command,
     vendors_command,
 )
+from financial_analytics.cli.context import AppContext
 from financial_analytics.cli.init import init_command
 from financial_analytics.cli.sync import sync_command
 from financial_analytics.core.config import initialize_logger
@@ -27,6 +28,16 @@ app = typer.Typer(
 console = Console()
 
 
+@app.callback()
+def app_callback(ctx: typer.Context) -> None:
+    """
+    Comprehensive financial analytics and reporting from NetSuite and Salesforce.
+    """
+    # One settings object and DB session per invocation, closed on exit
+    ctx.obj = AppContext()
+    ctx.call_on_close(ctx.obj.close)
+
+
 # Register commands
 app.command(name="init")(init_command)
 app.command(name="sync")(sync_command)
@@ -4,38 +4,89 @@ Data synchronization command.
 Syncs data from NetSuite to local database.
 """
 
-from datetime import UTC, datetime
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from itertools import batched
+from operator import attrgetter
+from queue import Queue
+from threading import Thread
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.console import Console
 from rich.progress import Progress
 
-from financial_analytics.core.config import Settings
-from financial_analytics.db.models import (
-    DimCustomer,
-    DimVendor,
-    FactInvoice,
-    FactVendorBill,
-    SalesforceAccount,
-    SalesforceOpportunity,
+if TYPE_CHECKING:
+    from financial_analytics.cli.context import AppContext
+    from financial_analytics.db.models import Base
+
+console = Console()
+
+# Column name -> extractor DTO attribute, per synced table. Each map becomes one
+# attrgetter, so a row is read with a single call instead of per-field lookups.
+_VENDOR_FIELDS = (
+    ("id", "id"),
+    ("company_name", "companyName"),
+    ("email", "email"),
+    ("balance", "balance"),
+    ("terms", "terms"),
+    ("category", "category"),
+    ("currency", "currency"),
 )
-from financial_analytics.db.session import get_session
-from financial_analytics.extractors.netsuite_client import NetSuiteClient
-from financial_analytics.extractors.netsuite_queries import (
-    fetch_all_customers,
-    fetch_all_vendors,
-    fetch_invoices,
-    fetch_vendor_bills,
+_VENDOR_BILL_FIELDS = (
+    ("id", "id"),
+    ("tran_id", "tranId"),
+    ("vendor_id", "entity"),
+    ("amount", "amount"),
+    ("tran_date", "tranDate"),
+    ("due_date", "dueDate"),
+    ("status", "status"),
+    ("memo", "memo"),
 )
-from financial_analytics.extractors.salesforce_extractor import (
-    fetch_accounts,
-    fetch_opportunities,
+_CUSTOMER_FIELDS = (
+    ("id", "id"),
+    ("company_name", "companyName"),
+    ("email", "email"),
+    ("balance", "balance"),
+    ("sales_rep", "salesRep"),
+    ("category", "category"),
+)
+_INVOICE_FIELDS = (
+    ("id", "id"),
+    ("tran_id", "tranId"),
+    ("customer_id", "entity"),
+    ("amount", "amount"),
+    ("tran_date", "tranDate"),
+    ("due_date", "dueDate"),
+    ("status", "status"),
+)
+_OPPORTUNITY_FIELDS = (
+    ("id", "Id"),
+    ("name", "Name"),
+    ("amount", "Amount"),
+    ("close_date", "CloseDate"),
+    ("stage_name", "StageName"),
+    ("probability", "Probability"),
+    ("opp_type", "Type"),
+    ("account_id", "AccountId"),
+    ("account_name", "AccountName"),
+    ("industry", "Industry"),
+    ("owner_name", "OwnerName"),
+    ("is_closed", "IsClosed"),
+    ("is_won", "IsWon"),
+)
+_ACCOUNT_FIELDS = (
+    ("id", "Id"),
+    ("name", "Name"),
+    ("account_type", "Type"),
+    ("industry", "Industry"),
+    ("annual_revenue", "AnnualRevenue"),
+    ("employee_count", "NumberOfEmployees"),
 )
-
-console = Console()
 
 
 def sync_command(
+    ctx: typer.Context,
     vendors_only: bool = typer.Option(False, "--vendors-only", help="Sync vendors only"),
     customers_only: bool = typer.Option(False, "--customers-only", help="Sync customers only"),
     salesforce_only: bool = typer.Option(False, "--salesforce-only", help="Sync Salesforce only"),
@@ -46,179 +97,175 @@ def sync_command(
 
     By default syncs all data. Use flags to sync specific datasets.
     """
+    from financial_analytics.db.models import (
+        DimCustomer,
+        DimVendor,
+        FactInvoice,
+        FactVendorBill,
+        SalesforceAccount,
+        SalesforceOpportunity,
+    )
+    from financial_analytics.db.session import COPY_BATCH_SIZE, bulk_upsert, copy_upsert
+    from financial_analytics.extractors.netsuite_client import NetSuiteClient
+    from financial_analytics.extractors.netsuite_queries import (
+        iter_customers,
+        iter_invoices,
+        iter_vendor_bills,
+        iter_vendors,
+    )
+    from financial_analytics.extractors.salesforce_extractor import (
+        iter_accounts,
+        iter_opportunities,
+    )
+
     console.print("[cyan]Starting data synchronization[/cyan]")
 
-    settings = Settings()  # type: ignore[call-arg]  # Reads from .env at runtime
-    session = get_session(settings)
+    app_context: AppContext = ctx.obj
+    settings, session = app_context.settings, app_context.session
 
     sync_all = not (vendors_only or customers_only or salesforce_only) or full
     sync_netsuite = sync_all or vendors_only or customers_only
     sync_salesforce = (sync_all or salesforce_only) and settings.sf_enabled
 
-    # Sync NetSuite data
-    if sync_netsuite:
-        console.print("\n[cyan]NetSuite Synchronization[/cyan]")
+    sync_vendors = sync_netsuite and (sync_all or vendors_only)
+    sync_customers = sync_netsuite and (sync_all or customers_only)
+
+    jobs: dict[str, Callable[[], Iterable[Any]]] = {}
+    targets: dict[str, tuple[type[Base], tuple[tuple[str, str], ...]]] = {}
 
     with NetSuiteClient(settings) as client:
-        # Sync vendors
-        if sync_netsuite and (sync_all or vendors_only):
-            console.print("\n[yellow]Syncing vendors...[/yellow]")
-            with Progress() as progress:
-                task = progress.add_task("Fetching vendors", total=None)
-                vendors = fetch_all_vendors(client, settings)
-                progress.update(task, completed=True)
-
-            console.print(f"Fetched {len(vendors)} vendors")
-
-            # Upsert to database
-            for vendor in vendors:
-                db_vendor = DimVendor(
-                    id=vendor.id,
-                    company_name=vendor.companyName,
-                    email=vendor.email,
-                    balance=vendor.balance,
-                    terms=vendor.terms,
-                    category=vendor.category,
-                    currency=vendor.currency,
-                    synced_at=datetime.now(UTC),
-                )
-                session.merge(db_vendor)
-
-            session.commit()
-            console.print("[green]Vendors synced successfully[/green]")
-
-            # Sync vendor bills
-            console.print("\n[yellow]Syncing vendor bills...[/yellow]")
-            with Progress() as progress:
-                task = progress.add_task("Fetching vendor bills", total=None)
-                bills = fetch_vendor_bills(client, settings)
-                progress.update(task, completed=True)
-
-            console.print(f"Fetched {len(bills)} vendor bills")
-
-            for bill in bills:
-                db_bill = FactVendorBill(
-                    id=bill.id,
-                    tran_id=bill.tranId,
-                    vendor_id=bill.entity,
-                    amount=bill.amount,
-                    tran_date=bill.tranDate,
-                    due_date=bill.dueDate,
-                    status=bill.status,
-                    memo=bill.memo,
-                    synced_at=datetime.now(UTC),
-                )
-                session.merge(db_bill)
-
-            session.commit()
-            console.print("[green]Vendor bills synced successfully[/green]")
-
-        # Sync customers
-        if sync_netsuite and (sync_all or customers_only):
-            console.print("\n[yellow]Syncing customers...[/yellow]")
-            with Progress() as progress:
-                task = progress.add_task("Fetching customers", total=None)
-                customers = fetch_all_customers(client, settings)
-                progress.update(task, completed=True)
-
-            console.print(f"Fetched {len(customers)} customers")
-
-            for customer in customers:
-                db_customer = DimCustomer(
-                    id=customer.id,
-                    company_name=customer.companyName,
-                    email=customer.email,
-                    balance=customer.balance,
-                    sales_rep=customer.salesRep,
-                    category=customer.category,
-                    synced_at=datetime.now(UTC),
-                )
-                session.merge(db_customer)
-
-            session.commit()
-            console.print("[green]Customers synced successfully[/green]")
-
-            # Sync invoices
-            console.print("\n[yellow]Syncing invoices...[/yellow]")
-            with Progress() as progress:
-                task = progress.add_task("Fetching invoices", total=None)
-                invoices = fetch_invoices(client, settings)
-                progress.update(task, completed=True)
-
-            console.print(f"Fetched {len(invoices)} invoices")
-
-            for invoice in invoices:
-                db_invoice = FactInvoice(
-                    id=invoice.id,
-                    tran_id=invoice.tranId,
-                    customer_id=invoice.entity,
-                    amount=invoice.amount,
-                    tran_date=invoice.tranDate,
-                    due_date=invoice.dueDate,
-                    status=invoice.status,
-                    synced_at=datetime.now(UTC),
-                )
-                session.merge(db_invoice)
-
-            session.commit()
-            console.print("[green]Invoices synced successfully[/green]")
-
-    # Sync Salesforce data
-    if sync_salesforce:
-        console.print("\n[cyan]Salesforce Synchronization[/cyan]")
-
-        console.print("\n[yellow]Syncing opportunities...[/yellow]")
-        with Progress() as progress:
-            task = progress.add_task("Fetching opportunities", total=None)
-            opportunities = fetch_opportunities(months_back=settings.analysis_months)
-            progress.update(task, completed=True)
-
-        console.print(f"Fetched {len(opportunities)} opportunities")
-
-        for opp in opportunities:
-            db_opp = SalesforceOpportunity(
-                id=opp.Id,
-                name=opp.Name,
-                amount=opp.Amount,
-                close_date=opp.CloseDate,
-                stage_name=opp.StageName,
-                probability=opp.Probability,
-                opp_type=opp.Type,
-                account_id=opp.AccountId,
-                account_name=opp.AccountName,
-                industry=opp.Industry,
-                owner_name=opp.OwnerName,
-                is_closed=opp.IsClosed,
-                is_won=opp.IsWon,
-                synced_at=datetime.now(UTC),
+        if sync_vendors:
+            jobs["vendors"] = partial(iter_vendors, client, settings)
+            targets["vendors"] = (DimVendor, _VENDOR_FIELDS)
+            jobs["vendor bills"] = partial(iter_vendor_bills, client, settings)
+            targets["vendor bills"] = (FactVendorBill, _VENDOR_BILL_FIELDS)
+        if sync_customers:
+            jobs["customers"] = partial(iter_customers, client, settings)
+            targets["customers"] = (DimCustomer, _CUSTOMER_FIELDS)
+            jobs["invoices"] = partial(iter_invoices, client, settings)
+            targets["invoices"] = (FactInvoice, _INVOICE_FIELDS)
+        if sync_salesforce:
+            jobs["opportunities"] = partial(
+                iter_opportunities,
+                months_back=settings.analysis_months,
+                max_concurrent_requests=settings.max_concurrent_requests,
             )
-            session.merge(db_opp)
-
-        session.commit()
-        console.print("[green]Opportunities synced successfully[/green]")
-
-        console.print("\n[yellow]Syncing accounts...[/yellow]")
-        with Progress() as progress:
-            task = progress.add_task("Fetching accounts", total=None)
-            accounts = fetch_accounts()
-            progress.update(task, completed=True)
-
-        console.print(f"Fetched {len(accounts)} accounts")
-
-        for account in accounts:
-            db_account = SalesforceAccount(
-                id=account.Id,
-                name=account.Name,
-                account_type=account.Type,
-                industry=account.Industry,
-                annual_revenue=account.AnnualRevenue,
-                employee_count=account.NumberOfEmployees,
-                synced_at=datetime.now(UTC),
+            targets["opportunities"] = (SalesforceOpportunity, _OPPORTUNITY_FIELDS)
+            jobs["accounts"] = partial(
+                iter_accounts, max_concurrent_requests=settings.max_concurrent_requests
             )
-            session.merge(db_account)
-
-        session.commit()
-        console.print("[green]Accounts synced successfully[/green]")
+            targets["accounts"] = (SalesforceAccount, _ACCOUNT_FIELDS)
+
+        counts = dict.fromkeys(jobs, 0)
+
+        # Entity types are fetched concurrently on worker threads, a page at a
+        # time, and written as soon as a batch's worth has arrived, so only
+        # about one batch of records is held in memory and database writes
+        # overlap the remaining API calls. All upserts share one transaction
+        # (a single commit): a failure part-way rolls back every entity type
+        # rather than leaving a mix.
+        with session.begin(), Progress(console=console) as progress:
+            tasks = {label: progress.add_task(f"Syncing {label}", total=None) for label in jobs}
+
+            # A full sync moves every row, so it stages large batches through COPY
+            upsert, batch_size = (
+                (copy_upsert, COPY_BATCH_SIZE) if full else (bulk_upsert, settings.page_size)
+            )
+            pending: dict[str, list[Any]] = {label: [] for label in jobs}
+            buffered = 0
+
+            def write(label: str) -> None:
+                nonlocal buffered
+                records, pending[label] = pending[label], []
+                model, field_map = targets[label]
+                upsert(session, model, _to_rows(records, field_map))
+                buffered -= len(records)
+                counts[label] += len(records)
+                progress.advance(tasks[label], len(records))
+
+            for label, page in _stream_concurrently(jobs, settings.page_size):
+                pending[label].extend(page)
+                buffered += len(page)
+                # Bound records held across all entity types, not per type:
+                # write the largest buffers until under one batch again
+                while buffered >= batch_size:
+                    write(max(pending, key=lambda name: len(pending[name])))
+            for label in jobs:
+                if pending[label]:
+                    write(label)
+
+            for label, task in tasks.items():
+                progress.update(task, total=counts[label], completed=counts[label])
+
+    for label, count in counts.items():
+        console.print(f"[green]Synced {count} {label}[/green]")
 
-    session.close()
     console.print("\n[green]Synchronization complete[/green]")
+
+
+def _stream_concurrently(
+    jobs: dict[str, Callable[[], Iterable[Any]]],
+    batch_size: int,
+) -> Iterator[tuple[str, tuple[Any, ...]]]:
+    """
+    Run independent fetches on worker threads, yielding batches as they arrive.
+
+    Workers block once two batches per job are waiting, so however slow the
+    consumer is, at most that many batches plus one being built per worker
+    are held; keep batch_size small (a page) to keep that bound small.
+
+    Args:
+        jobs: Label to zero-argument function returning an iterable of records
+        batch_size: Records per yielded batch
+
+    Yields:
+        (label, batch of records) in arrival order
+
+    Raises:
+        Exception: The first fetch failure, unchanged (fail-fast)
+    """
+    batches: Queue[tuple[str, tuple[Any, ...] | None] | BaseException] = Queue(
+        maxsize=2 * len(jobs)
+    )
+
+    def produce(label: str, fetch: Callable[[], Iterable[Any]]) -> None:
+        try:
+            for batch in batched(fetch(), batch_size):
+                batches.put((label, batch))
+            batches.put((label, None))
+        except BaseException as e:  # handed to the consumer, which re-raises
+            batches.put(e)
+
+    # Daemon threads: if the consumer fails, abandoned producers don't block exit
+    for label, fetch in jobs.items():
+        Thread(target=produce, args=(label, fetch), daemon=True).start()
+
+    remaining = len(jobs)
+    while remaining:
+        item = batches.get()
+        if isinstance(item, BaseException):
+            raise item
+        label, batch = item
+        if batch is None:
+            remaining -= 1
+        else:
+            yield label, batch
+
+
+def _to_rows(
+    records: Iterable[Any],
+    field_map: tuple[tuple[str, str], ...],
+) -> list[dict[str, Any]]:
+    """
+    Translate extractor records into bulk_upsert row dicts.
+
+    Args:
+        records: Extractor DTOs
+        field_map: (column name, DTO attribute) pairs
+
+    Returns:
+        One column-name to value mapping per record
+    """
+    columns = [column for column, _ in field_map]
+    get = attrgetter(*(attribute for _, attribute in field_map))
+    return [dict(zip(columns, get(record), strict=True)) for record in records]
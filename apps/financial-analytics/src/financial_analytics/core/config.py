@@ -6,6 +6,7 @@ Follows fail-fast discipline - missing config causes immediate failure.
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +14,7 @@ import yaml
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from financial_analytics.core.constants import DEFAULT_PAGE_SIZE, NETSUITE_MAX_PAGE_SIZE
 from financial_analytics.core.exceptions import ConfigurationError
 from libs.logger import get_logger as create_logger, load_logging_config
 
@@ -30,6 +32,8 @@ class NetSuiteConfig(BaseModel):
 
     account_id: str
     base_url: str | None = None
+    # Account-wide cap on in-flight requests (NetSuite concurrency governance)
+    concurrency_limit: int = Field(default=5, ge=1)
 
 
 class SalesforceConfig(BaseModel):
@@ -44,7 +48,10 @@ class AnalyticsConfig(BaseModel):
     default_period_months: int = 12
     vendor_analysis_top_n: int = 25
     duplicate_threshold: float = 0.85
-    page_size: int = 100
+    # Requests per record type scale with rows / page_size: use the largest page
+    page_size: int = Field(default=DEFAULT_PAGE_SIZE, ge=1, le=NETSUITE_MAX_PAGE_SIZE)
+    max_concurrent_requests: int = 4
+    max_requests_per_second: float = 10.0
     max_retries: int = 3
     retry_delay_seconds: int = 2
 
@@ -59,37 +66,77 @@ class YAMLConfig(BaseModel):
     analytics: AnalyticsConfig
 
 
-def load_yaml_config(path: Path) -> YAMLConfig:
+def _config_cache_key(path: Path) -> tuple[str, int]:
     """
-    Load and validate YAML configuration.
-
-    Args:
-        path: Path to config.yaml file
+    Cache key for a config file: absolute path plus modification time.
 
-    Returns:
-        Validated YAMLConfig object
+    Editing the file changes the key, so cached loads never go stale.
 
     Raises:
-        ConfigurationError: If config file missing or invalid
+        ConfigurationError: If config file missing
     """
     if not path.exists():
         raise ConfigurationError(
             f"Configuration file not found: {path}\n"
             f"Create a config.yaml file in the application directory."
         )
+    return str(path.resolve()), path.stat().st_mtime_ns
 
+
+@lru_cache(maxsize=4)
+def _read_yaml(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a YAML file (cached per path and mtime; callers must not mutate)."""
     try:
         with open(path) as f:
-            data: dict[str, Any] = yaml.safe_load(f)
+            return yaml.safe_load(f)
     except yaml.YAMLError as e:
         raise ConfigurationError(f"Invalid YAML in {path}: {e}") from e
 
+
+@lru_cache(maxsize=4)
+def _load_yaml_config(path: str, mtime_ns: int) -> YAMLConfig:
+    """Validate a parsed YAML file (cached per path and mtime)."""
+    data = _read_yaml(path, mtime_ns)
     try:
         return YAMLConfig(**data)
     except Exception as e:
         raise ConfigurationError(f"Invalid configuration structure in {path}: {e}") from e
 
 
+def read_yaml_file(path: Path) -> dict[str, Any]:
+    """
+    Load raw YAML configuration, shared with load_yaml_config's parse.
+
+    Args:
+        path: Path to config.yaml file
+
+    Returns:
+        Parsed YAML mapping (shared; do not mutate)
+
+    Raises:
+        ConfigurationError: If config file missing or invalid YAML
+    """
+    return _read_yaml(*_config_cache_key(path))
+
+
+def load_yaml_config(path: Path) -> YAMLConfig:
+    """
+    Load and validate YAML configuration.
+
+    Parsing and validation are cached per file path and modification time.
+
+    Args:
+        path: Path to config.yaml file
+
+    Returns:
+        Validated YAMLConfig object
+
+    Raises:
+        ConfigurationError: If config file missing or invalid
+    """
+    return _load_yaml_config(*_config_cache_key(path))
+
+
 class Settings(BaseSettings):
     """
     Application settings from .env and config.yaml.
@@ -107,6 +154,9 @@ class Settings(BaseSettings):
     # NetSuite credentials (from .env)
     ns_client_id: str = Field(..., description="NetSuite OAuth 2.0 Consumer Key")
     ns_client_secret: str = Field(..., description="NetSuite OAuth 2.0 Consumer Secret")
+    ns_token_cache: bool = Field(
+        default=True, description="Persist NetSuite access tokens between runs"
+    )
 
     # Database credentials (from .env)
     db_user: str = Field(..., description="PostgreSQL username")
@@ -137,11 +187,26 @@ class Settings(BaseSettings):
         """NetSuite account ID from YAML config."""
         return self.yaml_config.netsuite.account_id
 
+    @property
+    def ns_concurrency_limit(self) -> int:
+        """Maximum NetSuite requests in flight at once, across all fetches."""
+        return self.yaml_config.netsuite.concurrency_limit
+
     @property
     def page_size(self) -> int:
         """Default page size for API calls."""
         return self.yaml_config.analytics.page_size
 
+    @property
+    def max_concurrent_requests(self) -> int:
+        """Maximum pages of one record type fetched concurrently."""
+        return self.yaml_config.analytics.max_concurrent_requests
+
+    @property
+    def max_requests_per_second(self) -> float:
+        """Ceiling for the adaptive NetSuite request rate."""
+        return self.yaml_config.analytics.max_requests_per_second
+
     @property
     def max_retries(self) -> int:
         """Maximum retry attempts for API calls."""
@@ -168,6 +233,20 @@ class Settings(BaseSettings):
         return self.yaml_config.analytics.default_period_months
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get application settings (parsed once per process).
+
+    Returns:
+        Validated settings; config.yaml is loaded lazily and cached on it
+
+    Raises:
+        ValidationError: If required .env values are missing
+    """
+    return Settings()  # type: ignore[call-arg]  # Reads from .env at runtime
+
+
 # Global logger instance
 _app_logger: logging.Logger | None = None
 
@@ -202,19 +281,8 @@ def initialize_logger() -> logging.Logger:
     if _app_logger is not None:
         return _app_logger
 
-    # Load config
-    config_path = Path("config.yaml")
-    if not config_path.exists():
-        raise ConfigurationError(
-            f"Configuration file not found: {config_path}\n"
-            f"Create config.yaml with required settings."
-        )
-
-    try:
-        with open(config_path) as f:
-            config_dict = yaml.safe_load(f)
-    except Exception as e:
-        raise ConfigurationError(f"Failed to load config.yaml: {e}") from e
+    # Load config (same cached parse Settings.yaml_config uses)
+    config_dict = read_yaml_file(Path("config.yaml"))
 
     # Load logging config and create logger
     try:
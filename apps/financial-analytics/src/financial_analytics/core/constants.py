@@ -4,13 +4,21 @@ Application constants.
 Immutable values used throughout the application.
 """
 
+from functools import lru_cache
 from typing import Final
 
 # HTTP Methods
 ALLOWED_HTTP_METHODS: Final[frozenset[str]] = frozenset(["GET"])
 
+# Client errors that are transient (rate limiting); other 4xx fail immediately
+RETRYABLE_CLIENT_STATUS: Final[frozenset[int]] = frozenset([429])
+# Longest wait before one retry, whether from backoff or a Retry-After header
+MAX_RETRY_WAIT_SECONDS: Final[float] = 60.0
+
 # NetSuite API
 NETSUITE_API_VERSION: Final[str] = "v1"
+# Largest page the REST record API returns per request
+NETSUITE_MAX_PAGE_SIZE: Final[int] = 1000
 NETSUITE_BASE_URL_TEMPLATE: Final[str] = (
     "https://{account_id}.suitetalk.api.netsuite.com/services/rest/record/{version}"
 )
@@ -18,8 +26,21 @@ NETSUITE_OAUTH_URL_TEMPLATE: Final[str] = (
     "https://{account_id}.suitetalk.api.netsuite.com/rest/oauth2/token"
 )
 
+
+@lru_cache
+def netsuite_base_url(account_id: str) -> str:
+    """REST record API base URL for an account (formatted once per account)."""
+    return NETSUITE_BASE_URL_TEMPLATE.format(account_id=account_id, version=NETSUITE_API_VERSION)
+
+
+@lru_cache
+def netsuite_oauth_url(account_id: str) -> str:
+    """OAuth 2.0 token endpoint for an account (formatted once per account)."""
+    return NETSUITE_OAUTH_URL_TEMPLATE.format(account_id=account_id)
+
+
 # Database
-DEFAULT_PAGE_SIZE: Final[int] = 100
+DEFAULT_PAGE_SIZE: Final[int] = 1000
 DEFAULT_MAX_RETRIES: Final[int] = 3
 DEFAULT_RETRY_DELAY: Final[int] = 2
 
@@ -5,9 +5,9 @@ Based on financial-analytics database integration patterns.
 Follows fail-fast discipline with strict typing.
 """
 
-from datetime import UTC, datetime
+from datetime import datetime
 
-from sqlalchemy import Date, Float, Integer, String, Text
+from sqlalchemy import Date, Float, Index, Integer, String, Text, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -34,7 +34,8 @@ class DimVendor(Base):
     currency: Mapped[str | None] = mapped_column(String(10))
     synced_at: Mapped[datetime] = mapped_column(
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
 
@@ -51,7 +52,8 @@ class DimCustomer(Base):
     category: Mapped[str | None] = mapped_column(String(100))
     synced_at: Mapped[datetime] = mapped_column(
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
 
@@ -67,7 +69,8 @@ class DimAccount(Base):
     balance: Mapped[float] = mapped_column(Float, default=0.0)
     synced_at: Mapped[datetime] = mapped_column(
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
 
@@ -78,18 +81,25 @@ class FactVendorBill(Base):
     """Vendor bill fact table."""
 
     __tablename__ = "fact_vendor_bills"
+    __table_args__ = (
+        # Entity + period predicates; the leading column also serves lookups by
+        # vendor or status alone, so those have no single-column indexes
+        Index("ix_fact_vendor_bills_vendor_id_tran_date", "vendor_id", "tran_date"),
+        Index("ix_fact_vendor_bills_status_tran_date", "status", "tran_date"),
+    )
 
     id: Mapped[str] = mapped_column(String(50), primary_key=True)
     tran_id: Mapped[str] = mapped_column(String(100), index=True)
-    vendor_id: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    vendor_id: Mapped[str] = mapped_column(String(50), nullable=False)
     amount: Mapped[float] = mapped_column(Float, nullable=False)
     tran_date: Mapped[datetime] = mapped_column(Date, nullable=False, index=True)
     due_date: Mapped[datetime | None] = mapped_column(Date)
-    status: Mapped[str] = mapped_column(String(50), index=True)
+    status: Mapped[str] = mapped_column(String(50))
     memo: Mapped[str | None] = mapped_column(Text)
     synced_at: Mapped[datetime] = mapped_column(
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
 
@@ -97,17 +107,25 @@ class FactInvoice(Base):
     """Customer invoice fact table."""
 
     __tablename__ = "fact_invoices"
+    __table_args__ = (
+        # Covers monthly revenue trends: range filter on tran_date, distinct customers
+        Index("ix_fact_invoices_tran_date_customer_id", "tran_date", "customer_id"),
+        # Entity + period predicates (per-customer history, status over a period)
+        Index("ix_fact_invoices_customer_id_tran_date", "customer_id", "tran_date"),
+        Index("ix_fact_invoices_status_tran_date", "status", "tran_date"),
+    )
 
     id: Mapped[str] = mapped_column(String(50), primary_key=True)
     tran_id: Mapped[str] = mapped_column(String(100), index=True)
-    customer_id: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    customer_id: Mapped[str] = mapped_column(String(50), nullable=False)
     amount: Mapped[float] = mapped_column(Float, nullable=False)
-    tran_date: Mapped[datetime] = mapped_column(Date, nullable=False, index=True)
+    tran_date: Mapped[datetime] = mapped_column(Date, nullable=False)
     due_date: Mapped[datetime | None] = mapped_column(Date)
-    status: Mapped[str] = mapped_column(String(50), index=True)
+    status: Mapped[str] = mapped_column(String(50))
     synced_at: Mapped[datetime] = mapped_column(
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
 
@@ -128,7 +146,8 @@ class VendorSpendAnalysis(Base):
     last_transaction: Mapped[datetime | None] = mapped_column(Date)
     analysis_date: Mapped[datetime] = mapped_column(
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
         index=True,
     )
 
@@ -146,7 +165,8 @@ class RevenueTrends(Base):
     revenue_growth_pct: Mapped[float | None] = mapped_column(Float)
     analysis_date: Mapped[datetime] = mapped_column(
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
 
@@ -166,7 +186,8 @@ class FinancialKPIs(Base):
     debt_to_equity: Mapped[float | None] = mapped_column(Float)
     analysis_date: Mapped[datetime] = mapped_column(
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
 
@@ -193,7 +214,8 @@ class SalesforceOpportunity(Base):
     is_won: Mapped[bool] = mapped_column(nullable=False, default=False, index=True)
     synced_at: Mapped[datetime] = mapped_column(
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
 
 
@@ -210,5 +232,6 @@ class SalesforceAccount(Base):
     employee_count: Mapped[int | None] = mapped_column(Integer)
     synced_at: Mapped[datetime] = mapped_column(
         nullable=False,
-        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
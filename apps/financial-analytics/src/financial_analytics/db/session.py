@@ -4,17 +4,55 @@ Database session management.
 Following fail-fast discipline and vendor-analysis patterns.
 """
 
-from sqlalchemy import create_engine
+import csv
+import io
+from collections.abc import Sequence
+from functools import cache
+from typing import Any
+
+from psycopg2.extras import execute_values
+from sqlalchemy import (
+    Connection,
+    DefaultClause,
+    Dialect,
+    Engine,
+    Table,
+    create_engine,
+    literal,
+    text,
+)
+from sqlalchemy.engine.interfaces import DBAPICursor
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.schema import ColumnElementColumnDefault
 
 from financial_analytics.core.config import Settings, get_logger
 from financial_analytics.core.exceptions import DatabaseError
 from financial_analytics.db.models import Base
 
+# Single-column indexes superseded by composite indexes on the same leading
+# column; dropped by init_database so existing databases don't keep maintaining them
+_SUPERSEDED_INDEXES = (
+    "ix_fact_vendor_bills_vendor_id",
+    "ix_fact_vendor_bills_status",
+    "ix_fact_invoices_customer_id",
+    "ix_fact_invoices_tran_date",
+    "ix_fact_invoices_status",
+)
+
+# Rows per INSERT ... ON CONFLICT statement during sync
+UPSERT_CHUNK_SIZE = 1000
+
+# Rows per COPY into the staging table during a full sync
+COPY_BATCH_SIZE = 50_000
 
-def create_db_engine(database_url: str):
+
+@cache
+def create_db_engine(database_url: str) -> Engine:
     """
-    Create SQLAlchemy engine.
+    Get the pooled SQLAlchemy engine for a database URL.
+
+    Cached per URL so every session in the process shares one connection
+    pool instead of paying a fresh connect/auth handshake each time.
 
     Args:
         database_url: PostgreSQL connection URL
@@ -22,7 +60,23 @@ def create_db_engine(database_url: str):
     Returns:
         SQLAlchemy engine
     """
-    return create_engine(database_url, echo=False, future=True)
+    return create_engine(
+        database_url,
+        echo=False,
+        future=True,
+        pool_size=5,
+        max_overflow=10,
+        # Validate pooled connections before use; recycle before server idle timeouts
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        query_cache_size=1200,
+    )
+
+
+@cache
+def _session_factory(database_url: str) -> sessionmaker[Session]:
+    """Session factory bound to the cached engine for a database URL."""
+    return sessionmaker(bind=create_db_engine(database_url))
 
 
 def get_session(settings: Settings) -> Session:
@@ -41,9 +95,7 @@ def get_session(settings: Settings) -> Session:
     logger = get_logger()
     try:
         logger.debug("Creating database session")
-        engine = create_db_engine(settings.database_url)
-        session_factory = sessionmaker(bind=engine)
-        session = session_factory()
+        session = _session_factory(settings.database_url)()
         logger.debug("Database session created successfully")
         return session
     except Exception as e:
@@ -55,7 +107,8 @@ def init_database(settings: Settings) -> None:
     """
     Initialize database schema (idempotent).
 
-    Creates all tables if they don't exist.
+    Creates all tables and indexes if they don't exist, drops indexes
+    superseded by later composite indexes, and applies server-side defaults.
     Safe to run multiple times.
 
     Args:
@@ -69,7 +122,267 @@ def init_database(settings: Settings) -> None:
         logger.info("Initializing database schema")
         engine = create_db_engine(settings.database_url)
         Base.metadata.create_all(engine)
+        # create_all skips existing tables, so add indexes introduced since
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(engine, checkfirst=True)
+        with engine.begin() as conn:
+            for name in _SUPERSEDED_INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+            # Likewise for server-side column defaults
+            for table in Base.metadata.sorted_tables:
+                for column in table.columns:
+                    if isinstance(column.server_default, DefaultClause):
+                        # A plain string default is a literal value, as in CREATE TABLE
+                        arg = column.server_default.arg
+                        clause = literal(arg) if isinstance(arg, str) else arg
+                        default = clause.compile(
+                            dialect=engine.dialect, compile_kwargs={"literal_binds": True}
+                        )
+                        conn.execute(
+                            text(
+                                f"ALTER TABLE {table.name} "
+                                f"ALTER COLUMN {column.name} SET DEFAULT {default}"
+                            )
+                        )
         logger.info("Database schema initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         raise DatabaseError(f"Failed to initialize database: {e}") from e
+
+
+def _on_conflict_sql(
+    table: Table,
+    columns: tuple[str, ...],
+    conflict_cols: tuple[str, ...],
+    dialect: Dialect,
+) -> str:
+    """
+    Render the ON CONFLICT ... DO UPDATE clause for one upsert shape.
+
+    Args:
+        table: Target table
+        columns: Columns supplied by each row
+        conflict_cols: Unique columns identifying an existing row
+        dialect: Dialect used to quote identifiers and render SQL defaults
+
+    Returns:
+        ON CONFLICT clause updating every supplied non-key column
+    """
+    quote = dialect.identifier_preparer.quote
+
+    updates = [
+        f"{quote(name)} = EXCLUDED.{quote(name)}" for name in columns if name not in conflict_cols
+    ]
+    # ON CONFLICT DO UPDATE doesn't apply onupdate defaults by itself
+    updates += [
+        f"{quote(column.name)} = {column.onupdate.arg.compile(dialect=dialect)}"
+        for column in table.columns
+        if column.name not in columns
+        and column.name not in conflict_cols
+        and isinstance(column.onupdate, ColumnElementColumnDefault)
+    ]
+
+    return (
+        f"ON CONFLICT ({', '.join(map(quote, conflict_cols))}) DO UPDATE SET {', '.join(updates)}"
+    )
+
+
+@cache
+def _upsert_sql(
+    table: Table,
+    columns: tuple[str, ...],
+    conflict_cols: tuple[str, ...],
+    dialect: Dialect,
+) -> tuple[str, str]:
+    """
+    Build the execute_values query and row template for one upsert shape.
+
+    Args:
+        table: Target table
+        columns: Columns supplied by each row, in row order
+        conflict_cols: Unique columns identifying an existing row
+        dialect: Dialect used to quote identifiers and render SQL defaults
+
+    Returns:
+        (INSERT ... VALUES %s ON CONFLICT ... query, per-row VALUES template)
+    """
+    quote = dialect.identifier_preparer.quote
+
+    query = (
+        f"INSERT INTO {quote(table.name)} ({', '.join(map(quote, columns))}) VALUES %s "
+        + _on_conflict_sql(table, columns, conflict_cols, dialect)
+    )
+    template = f"({', '.join(f'%({name})s' for name in columns)})"
+    return query, template
+
+
+@cache
+def _copy_upsert_sql(
+    table: Table,
+    columns: tuple[str, ...],
+    conflict_cols: tuple[str, ...],
+    dialect: Dialect,
+) -> tuple[str, str, str, str]:
+    """
+    Build the staging-table statements for one COPY upsert shape.
+
+    Args:
+        table: Target table
+        columns: Columns supplied by each row, in row order
+        conflict_cols: Unique columns identifying an existing row
+        dialect: Dialect used to quote identifiers and render SQL defaults
+
+    Returns:
+        (create staging table, COPY into it, INSERT ... SELECT from it, empty it)
+    """
+    quote = dialect.identifier_preparer.quote
+    target = quote(table.name)
+    stage = quote(f"_stage_{table.name}")
+    column_list = ", ".join(map(quote, columns))
+
+    return (
+        f"CREATE TEMP TABLE IF NOT EXISTS {stage} "
+        f"(LIKE {target} INCLUDING DEFAULTS) ON COMMIT DROP",
+        f"COPY {stage} ({column_list}) FROM STDIN WITH (FORMAT csv)",
+        f"INSERT INTO {target} ({column_list}) SELECT {column_list} FROM {stage} "
+        + _on_conflict_sql(table, columns, conflict_cols, dialect),
+        f"TRUNCATE {stage}",
+    )
+
+
+def _last_row_per_key(
+    rows: Sequence[dict[str, Any]],
+    conflict_cols: Sequence[str],
+) -> Sequence[dict[str, Any]]:
+    """
+    Keep only the last row for each conflict key.
+
+    One ON CONFLICT DO UPDATE statement may not touch a row twice, and a
+    record that shifts pages during a concurrent fetch can arrive twice in
+    one batch. The later copy wins, as it would have with session.merge().
+
+    Args:
+        rows: Column-name to value mappings
+        conflict_cols: Unique columns identifying a row
+
+    Returns:
+        rows itself when no key repeats, else the deduplicated rows
+    """
+    by_key = {tuple(row[name] for name in conflict_cols): row for row in rows}
+    if len(by_key) == len(rows):
+        return rows
+    return list(by_key.values())
+
+
+def _raw_cursor(connection: Connection) -> DBAPICursor:
+    """
+    Open a DBAPI cursor on a connection's own driver connection.
+
+    Statements run on it share the connection's current transaction. The
+    caller closes the cursor.
+
+    Args:
+        connection: SQLAlchemy connection (e.g. session.connection())
+
+    Returns:
+        Driver-level cursor
+
+    Raises:
+        DatabaseError: If the connection has been invalidated
+    """
+    dbapi_connection = connection.connection.dbapi_connection
+    if dbapi_connection is None:
+        raise DatabaseError("Database connection was invalidated")
+    return dbapi_connection.cursor()
+
+
+def bulk_upsert(
+    session: Session,
+    model: type[Base],
+    rows: Sequence[dict[str, Any]],
+    conflict_cols: Sequence[str] = ("id",),
+    chunk_size: int = UPSERT_CHUNK_SIZE,
+) -> None:
+    """
+    Insert rows, updating existing ones on key conflict, in chunked statements.
+
+    Uses PostgreSQL INSERT ... ON CONFLICT DO UPDATE, replacing per-row
+    session.merge() (a SELECT plus INSERT/UPDATE round-trip per record).
+    Rows are plain dicts handed to psycopg2's execute_values, which renders
+    each chunk as one multi-row VALUES statement; the SQL text is built once
+    per table and column set, with no per-call expression compilation.
+    Runs on the session's own connection, so it does not commit and all
+    chunks share the caller's transaction.
+
+    Args:
+        session: Database session
+        model: Mapped model class to upsert into
+        rows: Column-name to value mappings, all with the same keys; for a
+            repeated conflict key only the last row is written
+        conflict_cols: Unique columns identifying an existing row
+        chunk_size: Rows per INSERT statement
+    """
+    if not rows:
+        return
+
+    rows = _last_row_per_key(rows, conflict_cols)
+    connection = session.connection()
+    query, template = _upsert_sql(
+        model.__table__, tuple(rows[0]), tuple(conflict_cols), connection.dialect
+    )
+
+    cursor = _raw_cursor(connection)
+    try:
+        execute_values(cursor, query, rows, template=template, page_size=chunk_size)
+    finally:
+        cursor.close()
+
+
+def copy_upsert(
+    session: Session,
+    model: type[Base],
+    rows: Sequence[dict[str, Any]],
+    conflict_cols: Sequence[str] = ("id",),
+) -> None:
+    """
+    Upsert rows via COPY into a staging table, then one INSERT ... SELECT.
+
+    COPY skips per-row statement parsing, so for large batches (full syncs)
+    it is far faster than multi-row INSERTs. The staging table is a temp
+    table dropped at commit and emptied after each call, so repeated calls
+    in one transaction reuse it. Runs on the session's own connection and
+    does not commit.
+
+    Args:
+        session: Database session
+        model: Mapped model class to upsert into
+        rows: Column-name to value mappings, all with the same keys; for a
+            repeated conflict key only the last row is written
+        conflict_cols: Unique columns identifying an existing row
+    """
+    if not rows:
+        return
+
+    rows = _last_row_per_key(rows, conflict_cols)
+    connection = session.connection()
+    columns = tuple(rows[0])
+    create, copy, insert, truncate = _copy_upsert_sql(
+        model.__table__, columns, tuple(conflict_cols), connection.dialect
+    )
+
+    # Quote every non-NULL field so empty strings stay distinct from NULL
+    buffer = io.StringIO()
+    csv.writer(buffer, quoting=csv.QUOTE_NOTNULL).writerows(
+        [row[name] for name in columns] for row in rows
+    )
+    buffer.seek(0)
+
+    cursor = _raw_cursor(connection)
+    try:
+        cursor.execute(create)
+        cursor.copy_expert(copy, buffer)
+        cursor.execute(insert)
+        cursor.execute(truncate)
+    finally:
+        cursor.close()
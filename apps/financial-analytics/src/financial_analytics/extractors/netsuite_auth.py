@@ -5,27 +5,118 @@ Implements OAuth 2.0 Client Credentials flow as required by NetSuite (Feb 2025+)
 Based on patterns from netsuite-integrations skill and vendor-analysis implementation.
 """
 
-from dataclasses import dataclass
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from pathlib import Path
 
 import httpx
 
-from financial_analytics.core.config import Settings
-from financial_analytics.core.constants import NETSUITE_OAUTH_URL_TEMPLATE
+from financial_analytics.core.config import Settings, get_logger
+from financial_analytics.core.constants import netsuite_oauth_url
 from financial_analytics.core.exceptions import NetSuiteConnectionError
 
 
 @dataclass
 class OAuth2Token:
-    """OAuth 2.0 access token with expiration tracking."""
+    """
+    OAuth 2.0 access token with expiration tracking.
+
+    expires_at is wall-clock time so the token can be persisted; expiry
+    checks use a monotonic deadline derived from it once at construction,
+    so they are cheap and unaffected by system clock adjustments.
+    """
 
     access_token: str
     token_type: str
     expires_at: datetime
+    _deadline: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive the monotonic refresh deadline (60 seconds before expiry)."""
+        remaining = (self.expires_at - datetime.now()).total_seconds()
+        self._deadline = time.monotonic() + remaining - 60
 
     def is_expired(self) -> bool:
         """Check if token is expired (with 60-second buffer)."""
-        return datetime.now() >= self.expires_at - timedelta(seconds=60)
+        return time.monotonic() >= self._deadline
+
+
+class FileTokenCache:
+    """
+    Access token persisted between runs in a private (0600) JSON file.
+
+    One file per account and client id under $XDG_CACHE_HOME (default
+    ~/.cache), so a new process reuses a still-valid token instead of
+    requesting another. A missing or unreadable file is a cache miss.
+    """
+
+    def __init__(self, account_id: str, client_id: str, cache_dir: Path | None = None) -> None:
+        """
+        Initialize token cache.
+
+        Args:
+            account_id: NetSuite account ID
+            client_id: OAuth 2.0 client ID
+            cache_dir: Directory for cache files (defaults to the XDG cache dir)
+        """
+        if cache_dir is None:
+            xdg_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+            cache_dir = Path(xdg_cache) / "financial_analytics"
+        key = hashlib.sha256(f"{account_id}:{client_id}".encode()).hexdigest()
+        self.path = cache_dir / f"ns_token_{key}.json"
+
+    def load(self) -> OAuth2Token | None:
+        """
+        Load the cached token.
+
+        Returns:
+            Cached token (possibly expired), or None if there is none
+        """
+        try:
+            data = json.loads(self.path.read_text())
+            return OAuth2Token(
+                access_token=data["access_token"],
+                token_type=data["token_type"],
+                expires_at=datetime.fromisoformat(data["expires_at"]),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, token: OAuth2Token) -> None:
+        """
+        Persist a token, atomically replacing any previous one.
+
+        A write failure only costs the next run a token request, so it is
+        logged rather than raised.
+
+        Args:
+            token: Token to persist
+        """
+        data = {
+            "access_token": token.access_token,
+            "token_type": token.token_type,
+            "expires_at": token.expires_at.isoformat(),
+        }
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # mkstemp creates the file 0600; rename keeps concurrent readers consistent
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                # Don't leave a stray copy of the token behind
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            get_logger().warning(f"Could not cache NetSuite token at {self.path}: {e}")
 
 
 class NetSuiteAuth:
@@ -36,21 +127,29 @@ class NetSuiteAuth:
     Fail-fast: Raises exception immediately on auth failure.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, client: httpx.Client) -> None:
         """
         Initialize NetSuite authentication.
 
         Args:
             settings: Application settings with NetSuite credentials
+            client: HTTP client for token requests, shared with API calls so
+                refreshes reuse its pooled keep-alive connections
 
         Raises:
             ConfigurationError: If required credentials missing
         """
         self.settings = settings
+        self.client = client
         self.token: OAuth2Token | None = None
-        self.oauth_url = NETSUITE_OAUTH_URL_TEMPLATE.format(
-            account_id=settings.ns_account_id
+        self.token_cache = (
+            FileTokenCache(settings.ns_account_id, settings.ns_client_id)
+            if settings.ns_token_cache
+            else None
         )
+        # Fetches share one client across threads; refresh the token only once
+        self._token_lock = threading.Lock()
+        self.oauth_url = netsuite_oauth_url(settings.ns_account_id)
 
     def get_access_token(self) -> str:
         """
@@ -62,21 +161,31 @@ class NetSuiteAuth:
         Raises:
             NetSuiteConnectionError: If token request fails
         """
-        if self.token is None or self.token.is_expired():
-            self._request_new_token()
+        with self._token_lock:
+            token = self.token
+            if token is None and self.token_cache is not None:
+                token = self.token_cache.load()
 
-        assert self.token is not None  # For type checker
-        return self.token.access_token
+            if token is None or token.is_expired():
+                token = self._request_new_token()
+                if self.token_cache is not None:
+                    self.token_cache.save(token)
 
-    def _request_new_token(self) -> None:
+            self.token = token
+            return token.access_token
+
+    def _request_new_token(self) -> OAuth2Token:
         """
         Request new OAuth 2.0 access token.
 
+        Returns:
+            Newly issued token
+
         Raises:
             NetSuiteConnectionError: If request fails
         """
         try:
-            response = httpx.post(
+            response = self.client.post(
                 self.oauth_url,
                 data={
                     "grant_type": "client_credentials",
@@ -84,7 +193,6 @@ class NetSuiteAuth:
                     "client_secret": self.settings.ns_client_secret,
                 },
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
-                timeout=30.0,
             )
             response.raise_for_status()
         except httpx.HTTPError as e:
@@ -94,7 +202,7 @@ class NetSuiteAuth:
 
         data = response.json()
 
-        self.token = OAuth2Token(
+        return OAuth2Token(
             access_token=data["access_token"],
             token_type=data["token_type"],
             expires_at=datetime.now() + timedelta(seconds=data["expires_in"]),
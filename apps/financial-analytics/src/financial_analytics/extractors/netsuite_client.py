@@ -5,16 +5,22 @@ CRITICAL: Enforces read-only operations following CLAUDE.md guidelines.
 Based on vendor-analysis implementation and netsuite-integrations skill.
 """
 
+import random
+import threading
 import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
+import orjson
 
 from financial_analytics.core.config import Settings, get_logger
 from financial_analytics.core.constants import (
     ALLOWED_HTTP_METHODS,
-    NETSUITE_API_VERSION,
-    NETSUITE_BASE_URL_TEMPLATE,
+    MAX_RETRY_WAIT_SECONDS,
+    RETRYABLE_CLIENT_STATUS,
+    netsuite_base_url,
 )
 from financial_analytics.core.exceptions import (
     NetSuiteAPIError,
@@ -22,6 +28,7 @@ from financial_analytics.core.exceptions import (
     ReadOnlyViolationError,
 )
 from financial_analytics.extractors.netsuite_auth import NetSuiteAuth
+from financial_analytics.extractors.rate_limiter import AdaptiveRateLimiter
 
 
 class NetSuiteClient:
@@ -44,12 +51,29 @@ class NetSuiteClient:
         """
         self.settings = settings
         self.logger = get_logger()
-        self.auth = NetSuiteAuth(settings)
-        self.base_url = NETSUITE_BASE_URL_TEMPLATE.format(
-            account_id=settings.ns_account_id,
-            version=NETSUITE_API_VERSION,
+        self.base_url = netsuite_base_url(settings.ns_account_id)
+        # One pooled client for API and token requests (same NetSuite host), so
+        # connections and TLS sessions are reused across calls and refreshes.
+        # HTTP/2 multiplexes concurrent page requests over one connection; with
+        # the brotli/zstd extras installed, httpx advertises those encodings.
+        # The pool is sized to the account's concurrency limit, so every
+        # permitted request has a kept-alive connection and none sit idle.
+        concurrency = settings.ns_concurrency_limit
+        self.client = httpx.Client(
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0, read=60.0),
+            limits=httpx.Limits(
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency,
+                keepalive_expiry=120,
+            ),
         )
-        self.client = httpx.Client(timeout=30.0)
+        # Concurrent fetches together may not exceed the account limit; waiting
+        # here rather than in the pool keeps httpx's pool timeout from firing
+        self._in_flight = threading.BoundedSemaphore(concurrency)
+        self.auth = NetSuiteAuth(settings, self.client)
+        # Paces requests from all fetcher threads; backs off on 429s
+        self.rate_limiter = AdaptiveRateLimiter(settings.max_requests_per_second)
         self.logger.debug(f"NetSuite client initialized for account {settings.ns_account_id}")
 
     def __enter__(self) -> "NetSuiteClient":
@@ -102,52 +126,59 @@ class NetSuiteClient:
         self._enforce_read_only(method)
 
         url = f"{self.base_url}/{endpoint}"
+        # Reads never carry a body, so no Content-Type
         headers = {
             **self.auth.get_auth_headers(),
             "Accept": "application/json",
-            "Content-Type": "application/json",
         }
 
         last_error: Exception | None = None
         max_retries = self.settings.max_retries
-        retry_delay = self.settings.retry_delay
 
         self.logger.debug(f"NetSuite API request: {method} {endpoint}")
 
         for attempt in range(max_retries):
+            retry_response: httpx.Response | None = None
+            self.rate_limiter.acquire()
             try:
-                response = self.client.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    params=params,
-                )
+                with self._in_flight:
+                    response = self.client.request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        params=params,
+                    )
                 response.raise_for_status()
+                self.rate_limiter.on_success()
                 self.logger.debug(f"NetSuite API success: {method} {endpoint}")
-                return response.json()
+                # orjson parses the raw bytes directly; pages run to 1000 records
+                return orjson.loads(response.content)
 
             except httpx.HTTPStatusError as e:
-                if e.response.status_code >= 400 and e.response.status_code < 500:
+                status = e.response.status_code
+                if status == 429:
+                    self.rate_limiter.on_throttled()
+                if status < 500 and status not in RETRYABLE_CLIENT_STATUS:
                     # Client errors - don't retry
                     self.logger.error(
                         f"NetSuite API client error: {method} {endpoint} - "
-                        f"Status {e.response.status_code}: {e.response.text}"
+                        f"Status {status}: {e.response.text}"
                     )
                     raise NetSuiteAPIError(
-                        f"NetSuite API error (HTTP {e.response.status_code}): "
-                        f"{e.response.text}"
+                        f"NetSuite API error (HTTP {status}): {e.response.text}"
                     ) from e
                 last_error = e
+                retry_response = e.response
 
             except httpx.HTTPError as e:
                 last_error = e
 
             if attempt < max_retries - 1:
                 retry_num = attempt + 1
-                wait_time = retry_delay * (2**attempt)
+                wait_time = self._retry_wait(retry_response, attempt)
                 self.logger.warning(
                     f"NetSuite API retry {retry_num}/{max_retries - 1}: "
-                    f"{method} {endpoint} - waiting {wait_time}s"
+                    f"{method} {endpoint} - waiting {wait_time:.1f}s"
                 )
                 time.sleep(wait_time)
 
@@ -158,6 +189,53 @@ class NetSuiteClient:
             f"Failed after {max_retries} attempts: {last_error}"
         ) from last_error
 
+    def _retry_wait(self, response: httpx.Response | None, attempt: int) -> float:
+        """
+        Seconds to wait before retrying a failed attempt.
+
+        Honors the server's Retry-After (seconds or HTTP date) on 429/503 up
+        to MAX_RETRY_WAIT_SECONDS; otherwise, or when the header asks for
+        longer, exponential backoff with jitter (also capped), so concurrent
+        fetchers hitting the same limit don't retry in lockstep and one bad
+        header can't stall a fetcher holding a request slot.
+
+        Args:
+            response: Failed response, or None for connection errors
+            attempt: Zero-based attempt number that failed
+
+        Returns:
+            Delay in seconds
+        """
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after is not None:
+            wait = self._parse_retry_after(retry_after)
+            if wait is not None and wait <= MAX_RETRY_WAIT_SECONDS:
+                return wait
+
+        backoff = min(self.settings.retry_delay * (2**attempt), MAX_RETRY_WAIT_SECONDS)
+        return backoff * random.uniform(0.5, 1.0)
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> float | None:
+        """
+        Seconds requested by a Retry-After header.
+
+        Args:
+            value: Header value (delay in seconds or an HTTP date)
+
+        Returns:
+            Non-negative delay in seconds, or None if unparseable
+        """
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
     def get_record(self, record_type: str, record_id: str) -> dict[str, Any]:
         """
         Get single record by ID.
@@ -180,6 +258,7 @@ class NetSuiteClient:
         record_type: str,
         limit: int = 100,
         offset: int = 0,
+        q: str | None = None,
     ) -> dict[str, Any]:
         """
         Query records with pagination.
@@ -188,6 +267,8 @@ class NetSuiteClient:
             record_type: Type of record to query
             limit: Maximum records to return
             offset: Starting offset for pagination
+            q: Server-side filter in REST record query syntax
+                (e.g. "entity ANY_OF [123]")
 
         Returns:
             Response with items array and pagination info
@@ -195,8 +276,10 @@ class NetSuiteClient:
         Raises:
             NetSuiteAPIError: If query fails
         """
-        params = {
+        params: dict[str, Any] = {
             "limit": limit,
             "offset": offset,
         }
+        if q is not None:
+            params["q"] = q
         return self._request("GET", record_type, params=params)
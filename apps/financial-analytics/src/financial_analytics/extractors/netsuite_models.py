@@ -3,15 +3,21 @@ Pydantic models for NetSuite API responses.
 
 Data validation at the boundary following fail-fast discipline.
 Based on financial-analytics skill integration patterns.
+
+Records are frozen, slotted pydantic dataclasses rather than BaseModels:
+extractions produce hundreds of thousands of them, and slots drop the
+per-instance __dict__. Validation is unchanged.
 """
 
 from datetime import date
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+from pydantic.dataclasses import dataclass
 
 
-class Vendor(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Vendor:
     """NetSuite vendor record."""
 
     id: str
@@ -23,7 +29,8 @@ class Vendor(BaseModel):
     currency: str | None = None
 
 
-class VendorBill(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class VendorBill:
     """NetSuite vendor bill transaction."""
 
     id: str
@@ -36,7 +43,8 @@ class VendorBill(BaseModel):
     memo: str | None = None
 
 
-class Customer(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Customer:
     """NetSuite customer record."""
 
     id: str
@@ -47,7 +55,8 @@ class Customer(BaseModel):
     category: str | None = None
 
 
-class Invoice(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Invoice:
     """NetSuite customer invoice."""
 
     id: str
@@ -59,7 +68,8 @@ class Invoice(BaseModel):
     status: str
 
 
-class Account(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Account:
     """Chart of accounts record."""
 
     id: str
@@ -69,7 +79,8 @@ class Account(BaseModel):
     balance: float = 0.0
 
 
-class Transaction(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Transaction:
     """General ledger transaction."""
 
     id: str
@@ -82,7 +93,8 @@ class Transaction(BaseModel):
     memo: str | None = None
 
 
-class NetSuiteResponse(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class NetSuiteResponse:
     """Generic NetSuite API response wrapper."""
 
     items: list[dict[str, Any]]
@@ -3,9 +3,21 @@ NetSuite data extraction queries.
 
 All queries are read-only using SuiteTalk REST API.
 Based on financial-analytics integration patterns.
+
+The iter_* functions yield validated records in page order, fetching a
+bounded window of pages concurrently; the fetch_* functions collect them
+into lists.
 """
 
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+
+from pydantic import TypeAdapter
+
 from financial_analytics.core.config import Settings
+from financial_analytics.core.exceptions import DataValidationError
 from financial_analytics.extractors.netsuite_client import NetSuiteClient
 from financial_analytics.extractors.netsuite_models import (
     Account,
@@ -15,193 +27,263 @@ from financial_analytics.extractors.netsuite_models import (
     VendorBill,
 )
 
+# Validate a whole page per call (one pydantic-core pass) instead of per record
+_VENDORS = TypeAdapter(list[Vendor])
+_VENDOR_BILLS = TypeAdapter(list[VendorBill])
+_CUSTOMERS = TypeAdapter(list[Customer])
+_INVOICES = TypeAdapter(list[Invoice])
+_ACCOUNTS = TypeAdapter(list[Account])
 
-def fetch_all_vendors(client: NetSuiteClient, settings: Settings) -> list[Vendor]:
+
+def _fetch_page[T](
+    client: NetSuiteClient,
+    adapter: TypeAdapter[list[T]],
+    record_type: str,
+    limit: int,
+    offset: int,
+    q: str | None = None,
+) -> tuple[list[T], bool, int | None]:
     """
-    Fetch all vendors from NetSuite with pagination.
+    Fetch and validate one page.
+
+    The raw JSON page is only referenced inside this call, so it is freed as
+    soon as it has been validated; callers hold models, never both.
 
     Args:
         client: NetSuite API client
-        settings: Application settings
+        adapter: Validator for a page of records
+        record_type: NetSuite record type (e.g. "vendor")
+        limit: Records per page
+        offset: Offset of the page's first record
+        q: Optional server-side filter (REST record query syntax)
 
     Returns:
-        List of Vendor objects
+        (validated records, hasMore, totalResults if reported)
     """
-    vendors: list[Vendor] = []
-    offset = 0
-    page_size = settings.page_size
+    response = client.query_records(record_type=record_type, limit=limit, offset=offset, q=q)
+    return (
+        adapter.validate_python(response.get("items", [])),
+        response.get("hasMore", False),
+        response.get("totalResults"),
+    )
 
-    while True:
-        response = client.query_records(
-            record_type="vendor",
-            limit=page_size,
-            offset=offset,
-        )
 
-        items = response.get("items", [])
-        if not items:
-            break
+def _iter_records[T](
+    client: NetSuiteClient,
+    adapter: TypeAdapter[list[T]],
+    record_type: str,
+    settings: Settings,
+    q: str | None = None,
+) -> Iterator[T]:
+    """
+    Yield validated records of one type in page order.
 
-        for item in items:
-            vendors.append(Vendor(**item))
+    The first page reports totalResults, which fixes every remaining offset;
+    those pages are then requested (and validated) concurrently, at most
+    settings.max_concurrent_requests in flight, so extraction time tracks
+    the number of page windows rather than pages. Only that window of pages
+    is held at once.
 
-        if not response.get("hasMore", False):
-            break
+    Args:
+        client: NetSuite API client (thread-safe; requests share its pool)
+        adapter: Validator for a page of records
+        record_type: NetSuite record type (e.g. "vendor")
+        settings: Application settings (page size and concurrency)
+        q: Optional server-side filter (REST record query syntax)
+
+    Yields:
+        Validated records
+    """
+    page_size = settings.page_size
+    fetch = partial(_fetch_page, client, adapter, record_type, page_size, q=q)
+
+    records, has_more, total = fetch(0)
+    yield from records
+
+    if not has_more:
+        return
+
+    if total is None:
+        # No total to plan from: follow hasMore one page at a time
+        offset = page_size
+        while True:
+            records, has_more, _ = fetch(offset)
+            if not records:
+                return
+            yield from records
+            if not has_more:
+                return
+            offset += page_size
+
+    window = settings.max_concurrent_requests
+    with ThreadPoolExecutor(max_workers=window) as executor:
+        pending: deque[Future[tuple[list[T], bool, int | None]]] = deque()
+        for offset in range(page_size, total, page_size):
+            pending.append(executor.submit(fetch, offset))
+            if len(pending) == window:
+                yield from pending.popleft().result()[0]
+        while pending:
+            yield from pending.popleft().result()[0]
+
+
+def iter_vendors(client: NetSuiteClient, settings: Settings) -> Iterator[Vendor]:
+    """
+    Stream all vendors from NetSuite, page by page.
 
-        offset += page_size
+    Args:
+        client: NetSuite API client
+        settings: Application settings
 
-    return vendors
+    Returns:
+        Iterator of Vendor objects
+    """
+    return _iter_records(client, _VENDORS, "vendor", settings)
 
 
-def fetch_vendor_bills(
+def iter_vendor_bills(
     client: NetSuiteClient,
     settings: Settings,
     vendor_id: str | None = None,
-) -> list[VendorBill]:
+) -> Iterator[VendorBill]:
     """
-    Fetch vendor bills (transactions).
+    Stream vendor bills (transactions), page by page.
 
     Args:
         client: NetSuite API client
         settings: Application settings
-        vendor_id: Optional vendor ID to filter by
+        vendor_id: Optional vendor ID to filter by (applied server-side)
 
     Returns:
-        List of VendorBill objects
-    """
-    bills: list[VendorBill] = []
-    offset = 0
-    page_size = settings.page_size
+        Iterator of VendorBill objects
 
-    while True:
-        response = client.query_records(
-            record_type="vendorBill",
-            limit=page_size,
-            offset=offset,
-        )
+    Raises:
+        DataValidationError: If vendor_id is not a numeric internal ID
+    """
+    q = None
+    if vendor_id is not None:
+        # Interpolated into the query string, so only accept internal IDs
+        if not vendor_id.isdigit():
+            raise DataValidationError(f"Invalid NetSuite vendor ID: {vendor_id!r}")
+        q = f"entity ANY_OF [{vendor_id}]"
 
-        items = response.get("items", [])
-        if not items:
-            break
+    return _iter_records(client, _VENDOR_BILLS, "vendorBill", settings, q=q)
 
-        for item in items:
-            if vendor_id is None or item.get("entity") == vendor_id:
-                bills.append(VendorBill(**item))
 
-        if not response.get("hasMore", False):
-            break
+def iter_customers(client: NetSuiteClient, settings: Settings) -> Iterator[Customer]:
+    """
+    Stream all customers from NetSuite, page by page.
 
-        offset += page_size
+    Args:
+        client: NetSuite API client
+        settings: Application settings
 
-    return bills
+    Returns:
+        Iterator of Customer objects
+    """
+    return _iter_records(client, _CUSTOMERS, "customer", settings)
 
 
-def fetch_all_customers(client: NetSuiteClient, settings: Settings) -> list[Customer]:
+def iter_invoices(client: NetSuiteClient, settings: Settings) -> Iterator[Invoice]:
     """
-    Fetch all customers from NetSuite.
+    Stream customer invoices, page by page.
 
     Args:
         client: NetSuite API client
         settings: Application settings
 
     Returns:
-        List of Customer objects
+        Iterator of Invoice objects
     """
-    customers: list[Customer] = []
-    offset = 0
-    page_size = settings.page_size
-
-    while True:
-        response = client.query_records(
-            record_type="customer",
-            limit=page_size,
-            offset=offset,
-        )
-
-        items = response.get("items", [])
-        if not items:
-            break
+    return _iter_records(client, _INVOICES, "invoice", settings)
 
-        for item in items:
-            customers.append(Customer(**item))
 
-        if not response.get("hasMore", False):
-            break
+def iter_chart_of_accounts(client: NetSuiteClient, settings: Settings) -> Iterator[Account]:
+    """
+    Stream the chart of accounts, page by page.
 
-        offset += page_size
+    Args:
+        client: NetSuite API client
+        settings: Application settings
 
-    return customers
+    Returns:
+        Iterator of Account objects
+    """
+    return _iter_records(client, _ACCOUNTS, "account", settings)
 
 
-def fetch_invoices(client: NetSuiteClient, settings: Settings) -> list[Invoice]:
+def fetch_all_vendors(client: NetSuiteClient, settings: Settings) -> list[Vendor]:
     """
-    Fetch customer invoices.
+    Fetch all vendors from NetSuite with pagination.
 
     Args:
         client: NetSuite API client
         settings: Application settings
 
     Returns:
-        List of Invoice objects
+        List of Vendor objects
     """
-    invoices: list[Invoice] = []
-    offset = 0
-    page_size = settings.page_size
-
-    while True:
-        response = client.query_records(
-            record_type="invoice",
-            limit=page_size,
-            offset=offset,
-        )
+    return list(iter_vendors(client, settings))
 
-        items = response.get("items", [])
-        if not items:
-            break
 
-        for item in items:
-            invoices.append(Invoice(**item))
+def fetch_vendor_bills(
+    client: NetSuiteClient,
+    settings: Settings,
+    vendor_id: str | None = None,
+) -> list[VendorBill]:
+    """
+    Fetch vendor bills (transactions).
 
-        if not response.get("hasMore", False):
-            break
+    Args:
+        client: NetSuite API client
+        settings: Application settings
+        vendor_id: Optional vendor ID to filter by (applied server-side)
 
-        offset += page_size
+    Returns:
+        List of VendorBill objects
 
-    return invoices
+    Raises:
+        DataValidationError: If vendor_id is not a numeric internal ID
+    """
+    return list(iter_vendor_bills(client, settings, vendor_id))
 
 
-def fetch_chart_of_accounts(client: NetSuiteClient, settings: Settings) -> list[Account]:
+def fetch_all_customers(client: NetSuiteClient, settings: Settings) -> list[Customer]:
     """
-    Fetch chart of accounts.
+    Fetch all customers from NetSuite.
 
     Args:
         client: NetSuite API client
         settings: Application settings
 
     Returns:
-        List of Account objects
+        List of Customer objects
     """
-    accounts: list[Account] = []
-    offset = 0
-    page_size = settings.page_size
+    return list(iter_customers(client, settings))
+
+
+def fetch_invoices(client: NetSuiteClient, settings: Settings) -> list[Invoice]:
+    """
+    Fetch customer invoices.
 
-    while True:
-        response = client.query_records(
-            record_type="account",
-            limit=page_size,
-            offset=offset,
-        )
+    Args:
+        client: NetSuite API client
+        settings: Application settings
 
-        items = response.get("items", [])
-        if not items:
-            break
+    Returns:
+        List of Invoice objects
+    """
+    return list(iter_invoices(client, settings))
 
-        for item in items:
-            accounts.append(Account(**item))
 
-        if not response.get("hasMore", False):
-            break
+def fetch_chart_of_accounts(client: NetSuiteClient, settings: Settings) -> list[Account]:
+    """
+    Fetch chart of accounts.
 
-        offset += page_size
+    Args:
+        client: NetSuite API client
+        settings: Application settings
 
-    return accounts
+    Returns:
+        List of Account objects
+    """
+    return list(iter_chart_of_accounts(client, settings))
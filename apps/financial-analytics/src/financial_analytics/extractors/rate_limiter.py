@@ -0,0 +1,64 @@
+"""
+Adaptive client-side rate limiting for API requests.
+
+Token bucket whose refill rate follows AIMD: halved on every throttled
+(HTTP 429) response, raised by a small step on every success, up to the
+configured ceiling.
+"""
+
+import threading
+import time
+
+# AIMD parameters: multiplicative decrease on 429, additive increase on success
+_DECREASE_FACTOR = 0.5
+_INCREASE_STEP = 0.1
+
+
+class AdaptiveRateLimiter:
+    """
+    Thread-safe token bucket with AIMD rate adjustment.
+
+    Shared by every thread issuing requests through one client, so
+    concurrent fetchers draw from a single request budget. Bursts are
+    capped at one second's worth of requests at the current rate.
+    """
+
+    def __init__(self, max_rate: float, min_rate: float = 0.5) -> None:
+        """
+        Initialize rate limiter.
+
+        Args:
+            max_rate: Ceiling in requests per second (also the starting rate)
+            min_rate: Floor the rate never decreases below
+        """
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.rate = max_rate
+        self._tokens = max_rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now (possibly going negative) and sleep outside
+            # the lock, so waiting threads are released in arrival order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_success(self) -> None:
+        """Record a successful response: raise the rate by one step."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + _INCREASE_STEP)
+
+    def on_throttled(self) -> None:
+        """Record a throttled (429) response: halve the rate."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * _DECREASE_FACTOR)
+            self._tokens = min(self._tokens, self.rate)
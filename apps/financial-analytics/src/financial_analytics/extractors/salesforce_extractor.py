@@ -3,20 +3,49 @@ Salesforce data extraction using MCP tools.
 
 Uses pdi-salesforce-sse3 MCP server for data access.
 Based on salesforce-mcp skill and financial-analytics integration patterns.
+
+The iter_* functions yield validated records in page order; the fetch_*
+functions collect them into lists.
 """
 
-from datetime import date, datetime, timedelta
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from functools import partial
+from math import ceil
 from typing import Any
 
-from pydantic import BaseModel
+from dateutil.relativedelta import relativedelta
+from pydantic.dataclasses import dataclass
 
 from financial_analytics.core.exceptions import SalesforceConnectionError
 
 # MCP tools are injected at runtime by the environment
 # They are not imported but available as global functions
 
-
-class SalesforceOpportunity(BaseModel):
+# SOQL is built once at import; only the cutoff date literal varies per call.
+# Pages are ordered by Id (unique and indexed) so pageNumber paging is stable:
+# ordering on a non-unique column can repeat or skip rows at page boundaries.
+_OPPORTUNITY_FIELDS = (
+    "Id, Name, Amount, CloseDate, StageName, Probability, Type, AccountId, "
+    "Account.Name, Account.Industry, Owner.Name, IsClosed, IsWon"
+)
+_OPPORTUNITIES_SOQL = (
+    f"SELECT {_OPPORTUNITY_FIELDS} FROM Opportunity WHERE CloseDate >= {{cutoff}} ORDER BY Id"
+)
+_CLOSED_WON_SOQL = (
+    f"SELECT {_OPPORTUNITY_FIELDS} FROM Opportunity "
+    "WHERE IsWon = true AND CloseDate >= {cutoff} ORDER BY Id"
+)
+_ACCOUNTS_SOQL = (
+    "SELECT Id, Name, Type, Industry, AnnualRevenue, NumberOfEmployees "
+    "FROM Account WHERE Type = 'Customer' ORDER BY Id"
+)
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class SalesforceOpportunity:
     """Salesforce Opportunity record for revenue analysis."""
 
     Id: str
@@ -34,7 +63,8 @@ class SalesforceOpportunity(BaseModel):
     IsWon: bool = False
 
 
-class SalesforceAccount(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class SalesforceAccount:
     """Salesforce Account record."""
 
     Id: str
@@ -45,237 +75,239 @@ class SalesforceAccount(BaseModel):
     NumberOfEmployees: int | None = None
 
 
-def fetch_opportunities(
-    months_back: int = 12,
-    page_size: int = 200,
-) -> list[SalesforceOpportunity]:
+def _month_cutoff(months_back: int) -> date:
+    """First day of the month months_back months before the current one."""
+    return date.today().replace(day=1) - relativedelta(months=months_back)
+
+
+def _query_page(soql: str, page_size: int, page: int) -> dict[str, Any]:
+    """Run one page of a SOQL query through the MCP tool."""
+    result: dict[str, Any] = mcp__pdi_salesforce_sse3__query(  # type: ignore[name-defined]
+        soql=soql,
+        pageNumber=page,
+        pageSize=page_size,
+    )
+    return result
+
+
+def _query_records(
+    soql: str,
+    page_size: int,
+    max_concurrent_requests: int,
+) -> Iterator[dict[str, Any]]:
     """
-    Fetch opportunities from Salesforce for revenue analysis.
+    Yield the raw records of a SOQL query in page order.
+
+    The first page reports totalSize, which fixes the page count; the
+    remaining pages are then requested concurrently, at most
+    max_concurrent_requests in flight, instead of one round-trip at a time.
 
     Args:
-        months_back: Number of months of historical data
+        soql: Query to run
         page_size: Records per page
+        max_concurrent_requests: Maximum pages requested at once
 
-    Returns:
-        List of opportunity records
-
-    Raises:
-        SalesforceConnectionError: If query fails
-    """
-    # Calculate cutoff date
-    cutoff = datetime.now().replace(day=1)
-    for _ in range(months_back):
-        cutoff = (cutoff.replace(day=1) - timedelta(days=1)).replace(day=1)
-
-    cutoff_str = cutoff.strftime("%Y-%m-%d")
-
-    soql = f"""
-        SELECT
-            Id,
-            Name,
-            Amount,
-            CloseDate,
-            StageName,
-            Probability,
-            Type,
-            Account.Name,
-            Account.Industry,
-            Owner.Name,
-            IsClosed,
-            IsWon
-        FROM Opportunity
-        WHERE CloseDate >= {cutoff_str}
-        ORDER BY CloseDate DESC
+    Yields:
+        Raw Salesforce records
     """
+    fetch = partial(_query_page, soql, page_size)
 
-    opportunities: list[SalesforceOpportunity] = []
-    page = 1
+    result = fetch(1)
+    yield from result.get("records", [])
 
-    try:
-        while True:
-            # Use MCP tool to query Salesforce
-            result: dict[str, Any] = mcp__pdi_salesforce_sse3__query(  # type: ignore[name-defined]
-                soql=soql,
-                pageNumber=page,
-                pageSize=page_size,
-            )
+    if not result.get("hasMore", False):
+        return
 
+    total = result.get("totalSize")
+    if total is None:
+        # No total to plan from: follow hasMore one page at a time
+        page = 2
+        while True:
+            result = fetch(page)
             records = result.get("records", [])
             if not records:
-                break
-
-            # Parse records
-            for record in records:
-                # Flatten nested Account and Owner data
-                account_name = None
-                industry = None
-                if "Account" in record and record["Account"]:
-                    account_name = record["Account"].get("Name")
-                    industry = record["Account"].get("Industry")
-
-                owner_name = None
-                if "Owner" in record and record["Owner"]:
-                    owner_name = record["Owner"].get("Name")
-
-                opportunities.append(
-                    SalesforceOpportunity(
-                        Id=record["Id"],
-                        Name=record["Name"],
-                        Amount=record.get("Amount"),
-                        CloseDate=record["CloseDate"],
-                        StageName=record["StageName"],
-                        Probability=record.get("Probability"),
-                        Type=record.get("Type"),
-                        AccountId=record.get("AccountId"),
-                        AccountName=account_name,
-                        Industry=industry,
-                        OwnerName=owner_name,
-                        IsClosed=record.get("IsClosed", False),
-                        IsWon=record.get("IsWon", False),
-                    )
-                )
-
+                return
+            yield from records
             if not result.get("hasMore", False):
-                break
-
+                return
             page += 1
 
+    with ThreadPoolExecutor(max_workers=max_concurrent_requests) as executor:
+        pending: deque[Future[dict[str, Any]]] = deque()
+        for page in range(2, ceil(total / page_size) + 1):
+            pending.append(executor.submit(fetch, page))
+            if len(pending) == max_concurrent_requests:
+                yield from pending.popleft().result().get("records", [])
+        while pending:
+            yield from pending.popleft().result().get("records", [])
+
+
+def _to_opportunity(record: dict[str, Any]) -> SalesforceOpportunity:
+    """Build an opportunity from a raw record, flattening Account and Owner."""
+    account = record.get("Account") or {}
+    owner = record.get("Owner") or {}
+    return SalesforceOpportunity(
+        Id=record["Id"],
+        Name=record["Name"],
+        Amount=record.get("Amount"),
+        CloseDate=record["CloseDate"],
+        StageName=record["StageName"],
+        Probability=record.get("Probability"),
+        Type=record.get("Type"),
+        AccountId=record.get("AccountId"),
+        AccountName=account.get("Name"),
+        Industry=account.get("Industry"),
+        OwnerName=owner.get("Name"),
+        IsClosed=record.get("IsClosed", False),
+        IsWon=record.get("IsWon", False),
+    )
+
+
+def _iter_checked[T](records: Iterator[T], what: str) -> Iterator[T]:
+    """Re-raise any failure while consuming records as SalesforceConnectionError."""
+    try:
+        yield from records
     except Exception as e:
-        raise SalesforceConnectionError(f"Failed to fetch opportunities: {e}") from e
-
-    return opportunities
+        raise SalesforceConnectionError(f"Failed to fetch {what}: {e}") from e
 
 
-def fetch_closed_won_opportunities(months_back: int = 12) -> list[SalesforceOpportunity]:
+def iter_opportunities(
+    months_back: int = 12,
+    page_size: int = 200,
+    max_concurrent_requests: int = 4,
+) -> Iterator[SalesforceOpportunity]:
     """
-    Fetch closed-won opportunities for revenue analysis.
+    Stream opportunities from Salesforce, page by page.
 
     Args:
         months_back: Number of months of historical data
+        page_size: Records per page
+        max_concurrent_requests: Maximum pages requested at once
 
     Returns:
-        List of closed-won opportunities
+        Iterator of opportunity records
+
+    Raises:
+        SalesforceConnectionError: If a query fails (raised while iterating)
     """
-    cutoff = datetime.now().replace(day=1)
-    for _ in range(months_back):
-        cutoff = (cutoff.replace(day=1) - timedelta(days=1)).replace(day=1)
-
-    cutoff_str = cutoff.strftime("%Y-%m-%d")
-
-    soql = f"""
-        SELECT
-            Id,
-            Name,
-            Amount,
-            CloseDate,
-            StageName,
-            Account.Name,
-            Account.Industry,
-            Owner.Name
-        FROM Opportunity
-        WHERE IsWon = true
-        AND CloseDate >= {cutoff_str}
-        ORDER BY CloseDate DESC
+    soql = _OPPORTUNITIES_SOQL.format(cutoff=_month_cutoff(months_back).isoformat())
+    return _iter_checked(
+        map(_to_opportunity, _query_records(soql, page_size, max_concurrent_requests)),
+        "opportunities",
+    )
+
+
+def iter_closed_won_opportunities(
+    months_back: int = 12,
+    page_size: int = 200,
+    max_concurrent_requests: int = 4,
+) -> Iterator[SalesforceOpportunity]:
     """
+    Stream closed-won opportunities, page by page.
 
-    opportunities: list[SalesforceOpportunity] = []
-    page = 1
+    Args:
+        months_back: Number of months of historical data
+        page_size: Records per page
+        max_concurrent_requests: Maximum pages requested at once
 
-    try:
-        while True:
-            result: dict[str, Any] = mcp__pdi_salesforce_sse3__query(  # type: ignore[name-defined]
-                soql=soql,
-                pageNumber=page,
-                pageSize=200,
-            )
+    Returns:
+        Iterator of closed-won opportunities
 
-            records = result.get("records", [])
-            if not records:
-                break
-
-            for record in records:
-                account_name = None
-                industry = None
-                if "Account" in record and record["Account"]:
-                    account_name = record["Account"].get("Name")
-                    industry = record["Account"].get("Industry")
-
-                owner_name = None
-                if "Owner" in record and record["Owner"]:
-                    owner_name = record["Owner"].get("Name")
-
-                opportunities.append(
-                    SalesforceOpportunity(
-                        Id=record["Id"],
-                        Name=record["Name"],
-                        Amount=record.get("Amount", 0.0),
-                        CloseDate=record["CloseDate"],
-                        StageName=record["StageName"],
-                        AccountName=account_name,
-                        Industry=industry,
-                        OwnerName=owner_name,
-                        IsWon=True,
-                    )
-                )
+    Raises:
+        SalesforceConnectionError: If a query fails (raised while iterating)
+    """
+    soql = _CLOSED_WON_SOQL.format(cutoff=_month_cutoff(months_back).isoformat())
+    return _iter_checked(
+        map(_to_opportunity, _query_records(soql, page_size, max_concurrent_requests)),
+        "closed-won opportunities",
+    )
 
-            if not result.get("hasMore", False):
-                break
 
-            page += 1
+def iter_accounts(
+    page_size: int = 200,
+    max_concurrent_requests: int = 4,
+) -> Iterator[SalesforceAccount]:
+    """
+    Stream Salesforce customer accounts, page by page.
 
-    except Exception as e:
-        raise SalesforceConnectionError(f"Failed to fetch closed-won opportunities: {e}") from e
+    Args:
+        page_size: Records per page
+        max_concurrent_requests: Maximum pages requested at once
 
-    return opportunities
+    Returns:
+        Iterator of account records
+
+    Raises:
+        SalesforceConnectionError: If a query fails (raised while iterating)
+    """
+    return _iter_checked(
+        (
+            SalesforceAccount(**record)
+            for record in _query_records(_ACCOUNTS_SOQL, page_size, max_concurrent_requests)
+        ),
+        "accounts",
+    )
 
 
-def fetch_accounts(page_size: int = 200) -> list[SalesforceAccount]:
+def fetch_opportunities(
+    months_back: int = 12,
+    page_size: int = 200,
+    max_concurrent_requests: int = 4,
+) -> list[SalesforceOpportunity]:
     """
-    Fetch Salesforce accounts.
+    Fetch opportunities from Salesforce for revenue analysis.
 
     Args:
+        months_back: Number of months of historical data
         page_size: Records per page
+        max_concurrent_requests: Maximum pages requested at once
 
     Returns:
-        List of account records
+        List of opportunity records
+
+    Raises:
+        SalesforceConnectionError: If query fails
     """
-    soql = """
-        SELECT
-            Id,
-            Name,
-            Type,
-            Industry,
-            AnnualRevenue,
-            NumberOfEmployees
-        FROM Account
-        WHERE Type = 'Customer'
-        ORDER BY Name ASC
+    return list(iter_opportunities(months_back, page_size, max_concurrent_requests))
+
+
+def fetch_closed_won_opportunities(
+    months_back: int = 12,
+    page_size: int = 200,
+    max_concurrent_requests: int = 4,
+) -> list[SalesforceOpportunity]:
     """
+    Fetch closed-won opportunities for revenue analysis.
 
-    accounts: list[SalesforceAccount] = []
-    page = 1
+    Args:
+        months_back: Number of months of historical data
+        page_size: Records per page
+        max_concurrent_requests: Maximum pages requested at once
 
-    try:
-        while True:
-            result: dict[str, Any] = mcp__pdi_salesforce_sse3__query(  # type: ignore[name-defined]
-                soql=soql,
-                pageNumber=page,
-                pageSize=page_size,
-            )
+    Returns:
+        List of closed-won opportunities
 
-            records = result.get("records", [])
-            if not records:
-                break
+    Raises:
+        SalesforceConnectionError: If query fails
+    """
+    return list(iter_closed_won_opportunities(months_back, page_size, max_concurrent_requests))
 
-            for record in records:
-                accounts.append(SalesforceAccount(**record))
 
-            if not result.get("hasMore", False):
-                break
+def fetch_accounts(
+    page_size: int = 200,
+    max_concurrent_requests: int = 4,
+) -> list[SalesforceAccount]:
+    """
+    Fetch Salesforce accounts.
 
-            page += 1
+    Args:
+        page_size: Records per page
+        max_concurrent_requests: Maximum pages requested at once
 
-    except Exception as e:
-        raise SalesforceConnectionError(f"Failed to fetch accounts: {e}") from e
+    Returns:
+        List of account records
 
-    return accounts
+    Raises:
+        SalesforceConnectionError: If query fails
+    """
+    return list(iter_accounts(page_size, max_concurrent_requests))
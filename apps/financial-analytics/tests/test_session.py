@@ -0,0 +1,60 @@
+"""Tests for the bulk upsert helpers in financial_analytics.db.session."""
+
+import csv
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from financial_analytics.db import session as db_session
+from financial_analytics.db.models import DimVendor
+
+
+def _vendor(vendor_id: str, company_name: str) -> dict[str, Any]:
+    return {"id": vendor_id, "company_name": company_name}
+
+
+@pytest.fixture
+def session() -> MagicMock:
+    """Session whose connection renders PostgreSQL SQL but talks to mocks."""
+    session = MagicMock()
+    session.connection.return_value.dialect = postgresql.dialect()
+    return session
+
+
+def test_bulk_upsert_keeps_last_row_for_repeated_id(
+    session: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    execute_values = MagicMock()
+    monkeypatch.setattr(db_session, "execute_values", execute_values)
+
+    rows = [_vendor("1", "Acme"), _vendor("2", "Globex"), _vendor("1", "Acme Corp")]
+    db_session.bulk_upsert(session, DimVendor, rows)
+
+    written = execute_values.call_args.args[2]
+    assert written == [_vendor("1", "Acme Corp"), _vendor("2", "Globex")]
+
+
+def test_copy_upsert_keeps_last_row_for_repeated_id(session: MagicMock) -> None:
+    rows = [_vendor("1", "Acme"), _vendor("2", "Globex"), _vendor("1", "Acme Corp")]
+    db_session.copy_upsert(session, DimVendor, rows)
+
+    cursor = session.connection.return_value.connection.dbapi_connection.cursor.return_value
+    buffer = cursor.copy_expert.call_args.args[1]
+    assert list(csv.reader(buffer.getvalue().splitlines())) == [
+        ["1", "Acme Corp"],
+        ["2", "Globex"],
+    ]
+
+
+def test_unique_rows_are_passed_through(
+    session: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    execute_values = MagicMock()
+    monkeypatch.setattr(db_session, "execute_values", execute_values)
+
+    rows = [_vendor("1", "Acme"), _vendor("2", "Globex")]
+    db_session.bulk_upsert(session, DimVendor, rows)
+
+    assert execute_values.call_args.args[2] is rows
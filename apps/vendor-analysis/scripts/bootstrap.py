@@ -7,11 +7,16 @@ Fail-fast - stops on first error with clear error messages.
 Logs to console (with colors) and bootstrap.log file.
 """
 
+import atexit
 import logging
+import queue
 import subprocess
 import sys
+import threading
+import time
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
-from typing import NoReturn
+from typing import IO, NoReturn
 
 # Rich console output
 try:
@@ -28,17 +33,40 @@ console = Console()
 
 # Dual logging: console (Rich) + file
 log_file = Path.cwd() / "bootstrap.log"
+log_format = "%(asctime)s - %(levelname)s - %(message)s"
+
+# File writes happen on a listener thread, buffered until 1024 records or an
+# error, so streaming command output never waits on disk. The console handler
+# stays synchronous to keep log lines in order with console.print output.
+# (QueueHandler formats records before queueing them, so the file handler
+# writes them as-is.)
+_file_handler = logging.FileHandler(log_file, mode="w", encoding="utf-8")
+_file_buffer = MemoryHandler(1024, flushLevel=logging.ERROR, target=_file_handler)
+_log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, _file_buffer)
+_log_listener.start()
+
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
+    format=log_format,
     handlers=[
         RichHandler(console=console, rich_tracebacks=True, markup=True),
-        logging.FileHandler(log_file, mode="w", encoding="utf-8"),
+        QueueHandler(_log_queue),
     ],
 )
 logger = logging.getLogger("bootstrap")
 
 
+def _stop_file_logging() -> None:
+    """Drain queued log records and flush them to the log file."""
+    atexit.unregister(_stop_file_logging)
+    _log_listener.stop()
+    _file_buffer.close()
+
+
+atexit.register(_stop_file_logging)
+
+
 class BootstrapError(Exception):
     """Fatal bootstrap error - fail fast."""
 
@@ -58,10 +86,45 @@ def fail(message: str) -> NoReturn:
     logger.error(message)
     console.print("\n[red bold]BOOTSTRAP FAILED[/red bold]")
     console.print(f"[red]{message}[/red]")
+    # Flush before pointing at the log file
+    _stop_file_logging()
     console.print(f"\n[yellow]Check {log_file} for details[/yellow]")
     sys.exit(1)
 
 
+# Command output is echoed once per this many lines or seconds, whichever first
+_OUTPUT_BATCH_LINES = 100
+_OUTPUT_BATCH_SECONDS = 0.25
+
+
+def _flush_output(lines: list[str]) -> None:
+    """
+    Echo a batch of command output to console and log.
+
+    Args:
+        lines: Output lines (trailing whitespace stripped)
+    """
+    if not lines:
+        return
+    # Print to console (verbatim: command output is not Rich markup)
+    console.print("\n".join(f"  {line}" for line in lines), style="dim", markup=False)
+    # Write to log file
+    logger.debug("\n".join(lines))
+
+
+def _read_lines(stream: IO[str], lines: queue.Queue[str | None]) -> None:
+    """
+    Forward lines from a pipe to a queue, then None at end of stream.
+
+    Args:
+        stream: Text pipe to read until EOF
+        lines: Queue receiving each line
+    """
+    for line in stream:
+        lines.put(line)
+    lines.put(None)
+
+
 def run_command(
     cmd: list[str],
     description: str,
@@ -94,18 +157,40 @@ def run_command(
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
-            bufsize=1,
+            bufsize=-1,
         )
 
         output_lines: list[str] = []
         if process.stdout:
-            for line in process.stdout:
-                line = line.rstrip()
-                output_lines.append(line)
-                # Print to console
-                console.print(f"  [dim]{line}[/dim]")
-                # Write to log file
-                logger.debug(line)
+            # Flush to console and log in batches rather than per line: verbose
+            # commands (uv sync) print thousands of lines. The pipe is read on
+            # a thread so a batch is also flushed when the command goes quiet,
+            # not only when its next line arrives.
+            pending: queue.Queue[str | None] = queue.Queue()
+            threading.Thread(
+                target=_read_lines, args=(process.stdout, pending), daemon=True
+            ).start()
+
+            batch_start = 0
+            deadline = time.monotonic() + _OUTPUT_BATCH_SECONDS
+            while True:
+                try:
+                    line = pending.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    pass  # Quiet until the deadline: flush what has arrived
+                else:
+                    if line is None:
+                        break
+                    output_lines.append(line.rstrip())
+                    if (
+                        len(output_lines) - batch_start < _OUTPUT_BATCH_LINES
+                        and time.monotonic() < deadline
+                    ):
+                        continue
+                _flush_output(output_lines[batch_start:])
+                batch_start = len(output_lines)
+                deadline = time.monotonic() + _OUTPUT_BATCH_SECONDS
+            _flush_output(output_lines[batch_start:])
 
         returncode = process.wait()
 
@@ -299,13 +384,10 @@ except Exception as e:
     sys.exit(1)
 """
 
-    test_file = project_dir / "test_db_connection.py"
-
     try:
-        test_file.write_text(test_script)
-
+        # Passed with -c: no scratch file to write and clean up
         result = subprocess.run(
-            ["uv", "run", "python", "test_db_connection.py"],
+            ["uv", "run", "python", "-c", test_script],
             cwd=project_dir,
             capture_output=True,
             text=True,
@@ -323,13 +405,6 @@ except Exception as e:
     except Exception as e:
         logger.warning(f"Database check error: {e}")
         return False
-    finally:
-        # Always clean up test file
-        if test_file.exists():
-            try:
-                test_file.unlink()
-            except Exception as cleanup_error:
-                logger.warning(f"Failed to clean up test file: {cleanup_error}")
 
 
 def create_database_if_needed() -> None:
@@ -4,12 +4,14 @@ Run database migration to add custom fields support.
 
 This script:
 1. Connects to the PostgreSQL database
-2. Runs the SQL migration script
+2. Runs the SQL migration script, one statement at a time
 3. Verifies the migration succeeded
 """
 
+import re
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, cast
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -20,9 +22,73 @@ from vendor_analysis.core.config import get_settings
 from vendor_analysis.db.session import get_session
 
 from rich.console import Console
+from rich.progress import track
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
 
 console = Console()
 
+# Where a statement's text may change meaning: comments, quoted strings and
+# identifiers, dollar-quoted bodies ($$ or $tag$), and statement ends
+_SQL_TOKEN = re.compile(r"--|/\*|['\";]|\$(?:[A-Za-z_][A-Za-z_0-9]*)?\$")
+
+# Transaction control in the script is replaced by the runner's own
+_TRANSACTION_CONTROL = {"BEGIN", "COMMIT", "END", "ROLLBACK", "START"}
+
+# Statements PostgreSQL refuses to run inside a transaction block
+_CONCURRENTLY = re.compile(r"\bCONCURRENTLY\b", re.IGNORECASE)
+
+
+def _split_statements(sql: str) -> list[str]:
+    """
+    Split a SQL script into statements on top-level semicolons.
+
+    Semicolons inside quotes, comments and dollar-quoted function bodies do
+    not end a statement. Comments outside those are dropped.
+
+    Args:
+        sql: SQL script text
+
+    Returns:
+        Non-empty statements, without trailing semicolons
+    """
+    statements: list[str] = []
+    current: list[str] = []
+    pos = 0
+    while match := _SQL_TOKEN.search(sql, pos):
+        current.append(sql[pos : match.start()])
+        token = match.group()
+        if token == ";":
+            statements.append("".join(current))
+            current = []
+            pos = match.end()
+            continue
+
+        if token == "--":
+            end = sql.find("\n", match.end())
+            pos = len(sql) if end == -1 else end
+            continue
+        if token == "/*":
+            end = sql.find("*/", match.end())
+            pos = len(sql) if end == -1 else end + 2
+            continue
+
+        if token in ("'", '"'):
+            # Quotes are escaped by doubling them
+            end = match.end()
+            while (end := sql.find(token, end)) != -1 and sql.startswith(token, end + 1):
+                end += 2
+        else:
+            end = sql.find(token, match.end())
+        end = len(sql) if end == -1 else end + len(token)
+        current.append(sql[match.start() : end])
+        pos = end
+
+    current.append(sql[pos:])
+    statements.append("".join(current))
+    return [statement.strip() for statement in statements if statement.strip()]
+
 
 def run_migration() -> None:
     """Run the database migration."""
@@ -44,12 +110,27 @@ def run_migration() -> None:
     with open(migration_file) as f:
         migration_sql = f.read()
 
+    statements = [
+        statement
+        for statement in _split_statements(migration_sql)
+        if statement.split(None, 1)[0].upper() not in _TRANSACTION_CONTROL
+    ]
+
     # Execute migration
-    console.print("[yellow]Executing migration...[/yellow]")
+    console.print(f"[yellow]Executing migration ({len(statements)} statements)...[/yellow]")
 
     try:
-        # Execute the SQL
-        session.execute(text(migration_sql))
+        for statement in track(statements, description="Migrating...", console=console):
+            if _CONCURRENTLY.search(statement):
+                # Runs outside any transaction: commit what came before it,
+                # then execute on its own autocommit connection
+                session.commit()
+                # get_session binds sessions to an engine, never a connection
+                engine = cast("Engine", session.get_bind())
+                with engine.connect() as conn:
+                    conn.execution_options(isolation_level="AUTOCOMMIT").execute(text(statement))
+            else:
+                session.execute(text(statement))
         session.commit()
 
         console.print("[green]✓ Migration completed successfully![/green]")
@@ -1,8 +1,12 @@
 """Vendor duplicate detection using fuzzy string matching."""
 
+import re
+from collections import defaultdict
 from dataclasses import dataclass
-from difflib import SequenceMatcher
 
+import numpy as np
+from rapidfuzz import fuzz, process
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from vendor_analysis.core.config import Settings
@@ -20,6 +24,73 @@ class DuplicatePair:
     similarity_score: float
 
 
+# Only the columns matching needs, as plain rows rather than ORM objects (which
+# would also load the custom_fields/raw_data JSONB), fetched 1000 per round-trip
+_ACTIVE_VENDOR_NAMES_STMT = (
+    select(VendorRecord.id, VendorRecord.company_name, VendorRecord.entity_id)
+    .where(VendorRecord.is_inactive.is_(False))
+    .execution_options(yield_per=1000)
+)
+
+# Scores computed per cdist call (4 MB as float32), so a block's score
+# matrix is built a slice of rows at a time
+_SLICE_SCORES = 1_000_000
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]")
+
+
+def _normalize(name: str) -> str:
+    """Normalize a vendor name for comparison."""
+    return name.lower().strip()
+
+
+def _blocking_key(name: str) -> str:
+    """First three alphanumeric characters of a normalized name."""
+    return _NON_ALNUM.sub("", name)[:3]
+
+
+def _score_block(
+    names: list[str],
+    members: list[int],
+    score_cutoff: float,
+) -> list[tuple[int, int, float]]:
+    """
+    Score every pair within one block.
+
+    Args:
+        names: All normalized vendor names
+        members: Ascending indices into names belonging to this block
+        score_cutoff: Minimum score (0-100) to report
+
+    Returns:
+        (index1, index2, score) for each pair at or above the cutoff, index1 < index2
+    """
+    block_names = [names[i] for i in members]
+    count = len(block_names)
+    rows_per_slice = max(1, _SLICE_SCORES // count)
+
+    pairs: list[tuple[int, int, float]] = []
+    for start in range(0, count - 1, rows_per_slice):
+        stop = min(start + rows_per_slice, count - 1)
+        # Rows start..stop-1 against every name after row start; cdist runs
+        # on all cores without the GIL
+        scores = process.cdist(
+            block_names[start:stop],
+            block_names[start + 1 :],
+            scorer=fuzz.ratio,
+            score_cutoff=score_cutoff,
+            workers=-1,
+        )
+        # Column c is name start+1+c, so c >= r keeps each pair once (j > i)
+        rows, cols = np.nonzero(np.triu(scores >= score_cutoff))
+        pairs.extend(
+            (members[start + r], members[start + 1 + c], float(scores[r, c]))
+            for r, c in zip(rows.tolist(), cols.tolist(), strict=True)
+        )
+
+    return pairs
+
+
 def calculate_similarity(str1: str, str2: str) -> float:
     """
     Calculate similarity between two strings.
@@ -34,11 +105,8 @@ def calculate_similarity(str1: str, str2: str) -> float:
     if not str1 or not str2:
         return 0.0
 
-    # Normalize strings
-    s1 = str1.lower().strip()
-    s2 = str2.lower().strip()
-
-    return SequenceMatcher(None, s1, s2).ratio()
+    # Same scorer and normalization as detect_duplicate_vendors
+    return fuzz.ratio(_normalize(str1), _normalize(str2)) / 100.0
 
 
 def detect_duplicate_vendors(
@@ -60,30 +128,46 @@ def detect_duplicate_vendors(
     if threshold is None:
         threshold = settings.duplicate_threshold
 
-    # Get all active vendors
-    vendors = session.query(VendorRecord).filter_by(is_inactive=False).all()
-
-    duplicates: list[DuplicatePair] = []
-
-    # Compare all pairs
-    for i, vendor1 in enumerate(vendors):
-        name1 = vendor1.company_name or vendor1.entity_id
-
-        for vendor2 in vendors[i + 1 :]:
-            name2 = vendor2.company_name or vendor2.entity_id
-
-            similarity = calculate_similarity(name1, name2)
-
-            if similarity >= threshold:
-                duplicates.append(
-                    DuplicatePair(
-                        vendor_1_id=vendor1.id,
-                        vendor_1_name=name1,
-                        vendor_2_id=vendor2.id,
-                        vendor_2_name=name2,
-                        similarity_score=similarity,
-                    )
-                )
+    # Stream active vendors' names in batches (server-side cursor)
+    rows = session.execute(_ACTIVE_VENDOR_NAMES_STMT)
+
+    # Blank names never match (as in calculate_similarity)
+    named = [
+        (vendor_id, name)
+        for vendor_id, company_name, entity_id in rows
+        if (name := company_name or entity_id) and name.strip()
+    ]
+    normalized = [_normalize(name) for _, name in named]
+
+    # Blocking: only names sharing their first three alphanumeric characters
+    # are scored against each other, so work grows with block sizes rather
+    # than with the square of the vendor count
+    blocks: dict[str, list[int]] = defaultdict(list)
+    for index, name in enumerate(normalized):
+        blocks[_blocking_key(name)].append(index)
+
+    # fuzz.ratio is 2*M/T with M the longest common subsequence (Indel
+    # distance). difflib's SequenceMatcher, used before, counts M from
+    # recursively matched contiguous blocks, which is never longer, so scores
+    # are at least as high as they were: a threshold tuned for the old scorer
+    # flags more pairs and may need raising
+    score_cutoff = threshold * 100
+
+    # Blocks are scored one after another: each cdist call already spreads
+    # its slice across every core, so a pool over blocks would only
+    # oversubscribe them
+    duplicates = [
+        DuplicatePair(
+            vendor_1_id=named[i][0],
+            vendor_1_name=named[i][1],
+            vendor_2_id=named[j][0],
+            vendor_2_name=named[j][1],
+            similarity_score=similarity / 100.0,
+        )
+        for members in blocks.values()
+        if len(members) > 1
+        for i, j, similarity in _score_block(normalized, members, score_cutoff)
+    ]
 
     # Sort by similarity score descending
     duplicates.sort(key=lambda x: x.similarity_score, reverse=True)
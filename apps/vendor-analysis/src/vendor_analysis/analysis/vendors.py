@@ -1,14 +1,38 @@
 """Vendor spend analysis and reporting."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
-import pandas as pd
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from vendor_analysis.core.config import Settings
 from vendor_analysis.db.models import TransactionRecord, VendorRecord
 
+# Per-vendor spend aggregated in the database, largest spend first. The inner
+# join drops transactions whose vendor is not stored locally.
+_TOTAL_SPEND = func.sum(TransactionRecord.amount)
+_VENDOR_SPEND_STMT = (
+    select(
+        TransactionRecord.vendor_id,
+        VendorRecord.company_name,
+        VendorRecord.entity_id,
+        _TOTAL_SPEND,
+        func.count(),
+        func.avg(TransactionRecord.amount),
+        func.min(TransactionRecord.currency),
+        func.max(TransactionRecord.tran_date),
+    )
+    .join(VendorRecord, VendorRecord.id == TransactionRecord.vendor_id)
+    .group_by(TransactionRecord.vendor_id, VendorRecord.company_name, VendorRecord.entity_id)
+    .order_by(_TOTAL_SPEND.desc())
+)
+
+# Column types of a _VENDOR_SPEND_STMT row
+type _VendorSpendRow = tuple[str, str | None, str, float, int, Any, str | None, datetime | None]
+
 
 @dataclass
 class VendorSpendSummary:
@@ -23,6 +47,69 @@ class VendorSpendSummary:
     last_transaction_date: datetime | None
 
 
+def _to_summaries(rows: Iterable[_VendorSpendRow]) -> list[VendorSpendSummary]:
+    """Build spend summaries from _VENDOR_SPEND_STMT result rows."""
+    return [
+        VendorSpendSummary(
+            vendor_id=vendor_id,
+            vendor_name=company_name or entity_id,
+            total_spend=float(total_spend),
+            transaction_count=transaction_count,
+            average_transaction=float(average_transaction),
+            currency=currency,
+            last_transaction_date=last_transaction_date,
+        )
+        for (
+            vendor_id,
+            company_name,
+            entity_id,
+            total_spend,
+            transaction_count,
+            average_transaction,
+            currency,
+            last_transaction_date,
+        ) in rows
+    ]
+
+
+def _aggregate_vendor_spend(
+    session: Session,
+    *,
+    vendor_id: str | None = None,
+    top_n: int | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list[VendorSpendSummary]:
+    """
+    Run the per-vendor spend aggregation with optional filters.
+
+    Every filter is applied in the single SQL statement, so callers never
+    aggregate more rows than they return.
+
+    Args:
+        session: Database session
+        vendor_id: Only this vendor's transactions (None = all vendors)
+        top_n: Return at most this many vendors (None = no limit)
+        start: Only transactions on or after this date
+        end: Only transactions on or before this date
+
+    Returns:
+        List of VendorSpendSummary objects sorted by total spend
+    """
+    stmt = _VENDOR_SPEND_STMT
+    if vendor_id:
+        stmt = stmt.where(TransactionRecord.vendor_id == vendor_id)
+    if start is not None:
+        stmt = stmt.where(TransactionRecord.tran_date >= start)
+    if end is not None:
+        stmt = stmt.where(TransactionRecord.tran_date <= end)
+    if top_n is not None:
+        # ORDER BY ... LIMIT in the database: only the top N rows are returned
+        stmt = stmt.limit(top_n)
+
+    return _to_summaries(session.execute(stmt).tuples())
+
+
 def analyze_vendor_spend(
     session: Session,
     settings: Settings,
@@ -39,56 +126,7 @@ def analyze_vendor_spend(
     Returns:
         List of VendorSpendSummary objects sorted by total spend
     """
-    # Build query
-    query = session.query(TransactionRecord)
-    if vendor_id:
-        query = query.filter(TransactionRecord.vendor_id == vendor_id)
-
-    transactions = query.all()
-
-    if not transactions:
-        return []
-
-    # Convert to pandas for analysis
-    df = pd.DataFrame(
-        [
-            {
-                "vendor_id": t.vendor_id,
-                "amount": t.amount,
-                "tran_date": t.tran_date,
-                "currency": t.currency,
-            }
-            for t in transactions
-        ]
-    )
-
-    # Group by vendor
-    summary_data: list[VendorSpendSummary] = []
-
-    for vendor_id_group, group_df in df.groupby("vendor_id"):
-        # Get vendor details
-        vendor = session.query(VendorRecord).filter_by(id=str(vendor_id_group)).first()
-        if not vendor:
-            continue
-
-        currency_series = group_df["currency"]
-        currency_value = currency_series.iloc[0] if not currency_series.isna().all() else None
-
-        summary = VendorSpendSummary(
-            vendor_id=str(vendor_id_group),
-            vendor_name=vendor.company_name or vendor.entity_id,
-            total_spend=float(group_df["amount"].sum()),
-            transaction_count=len(group_df),
-            average_transaction=float(group_df["amount"].mean()),
-            currency=currency_value,
-            last_transaction_date=group_df["tran_date"].max(),
-        )
-        summary_data.append(summary)
-
-    # Sort by total spend descending
-    summary_data.sort(key=lambda x: x.total_spend, reverse=True)
-
-    return summary_data
+    return _aggregate_vendor_spend(session, vendor_id=vendor_id)
 
 
 def get_top_vendors(
@@ -110,8 +148,7 @@ def get_top_vendors(
     if top_n is None:
         top_n = settings.top_vendors_count
 
-    all_summaries = analyze_vendor_spend(session, settings)
-    return all_summaries[:top_n]
+    return _aggregate_vendor_spend(session, top_n=top_n)
 
 
 def get_vendors_by_date_range(
@@ -130,51 +167,4 @@ def get_vendors_by_date_range(
     Returns:
         Vendor summaries for date range
     """
-    transactions = (
-        session.query(TransactionRecord)
-        .filter(
-            TransactionRecord.tran_date >= start_date,
-            TransactionRecord.tran_date <= end_date,
-        )
-        .all()
-    )
-
-    if not transactions:
-        return []
-
-    # Group and aggregate (similar to analyze_vendor_spend but filtered)
-    df = pd.DataFrame(
-        [
-            {
-                "vendor_id": t.vendor_id,
-                "amount": t.amount,
-                "tran_date": t.tran_date,
-                "currency": t.currency,
-            }
-            for t in transactions
-        ]
-    )
-
-    summary_data: list[VendorSpendSummary] = []
-
-    for vendor_id, group_df in df.groupby("vendor_id"):
-        vendor = session.query(VendorRecord).filter_by(id=str(vendor_id)).first()
-        if not vendor:
-            continue
-
-        currency_series = group_df["currency"]
-        currency_value = currency_series.iloc[0] if not currency_series.isna().all() else None
-
-        summary = VendorSpendSummary(
-            vendor_id=str(vendor_id),
-            vendor_name=vendor.company_name or vendor.entity_id,
-            total_spend=float(group_df["amount"].sum()),
-            transaction_count=len(group_df),
-            average_transaction=float(group_df["amount"].mean()),
-            currency=currency_value,
-            last_transaction_date=group_df["tran_date"].max(),
-        )
-        summary_data.append(summary)
-
-    summary_data.sort(key=lambda x: x.total_spend, reverse=True)
-    return summary_data
+    return _aggregate_vendor_spend(session, start=start_date, end=end_date)
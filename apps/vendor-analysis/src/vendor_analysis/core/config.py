@@ -5,6 +5,7 @@ Loads from config.yaml and .env files.
 FAIL-FAST: No defaults, no fallbacks - missing config = application fails.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -191,10 +192,14 @@ class Settings(BaseSettings):
 _app_logger: logging.Logger | None = None
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get validated application settings.
 
+    Cached: .env and config.yaml are parsed once per process, and every
+    caller (CLI commands, scripts) shares the same Settings instance.
+
     Raises:
         ConfigurationError: If .env or config.yaml missing/invalid
     """